@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 import mimetypes
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
+from uuid import UUID
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from gme_app.models import (
     AudioProvider,
     ArtifactsList,
+    ProcessingRun,
     ProcessingRunsPage,
     Project,
+    ProjectBundle,
     ProjectMember,
     ProjectMembersPage,
     ProjectsPage,
@@ -37,7 +46,19 @@ class ApiError(Exception):
         return f"{prefix}{self.message}"
 
 
+@dataclass(slots=True)
+class _CachedResponse:
+    data: Any
+    etag: str | None
+    fetched_at: float
+
+
 class GMEManagementClient:
+    # Read-only listings the dashboard polls; answers are reused briefly and then revalidated by ETag.
+    CACHE_TTL_SECONDS = 5.0
+    # Keep-alive sockets per host; sized for the GUI thread pool plus the nested per-refresh fan-out.
+    POOL_MAXSIZE = 64
+
     def __init__(
         self,
         *,
@@ -54,13 +75,28 @@ class GMEManagementClient:
         self.audio_service_api_key = (audio_service_api_key or "").strip() or None
         self.timeout_seconds = timeout_seconds
         self.session_cookie_name = session_cookie_name
-        self.session = requests.Session()
+        self.session = self._pooled_session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
                 "User-Agent": "gme-app/0.1.0",
             }
         )
+        # Video/audio services get their own keep-alive pool so the API session cookie never reaches them.
+        self.service_session = self._pooled_session()
+        self._cache: dict[tuple[str, tuple[tuple[str, Any], ...]], _CachedResponse] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        # One in-flight request per cache key; concurrent callers wait on it instead of re-sending.
+        self._inflight: dict[tuple[str, tuple[tuple[str, Any], ...]], Future[Any]] = {}
+
+    @classmethod
+    def _pooled_session(cls) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=cls.POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
@@ -108,7 +144,25 @@ class GMEManagementClient:
         **kwargs: Any,
     ) -> Any:
         response = self._request_raw(method, path, expected=expected, **kwargs)
-
+        if method.upper() != "GET":
+            self._invalidate_after_write(path)
+        return self._decode_response(response)
+
+    def _invalidate_after_write(self, path: str) -> None:
+        normalized = "/" + path.strip("/")
+        if normalized.endswith("/sync"):
+            # Sync only pulls run state from the processing service; callers use the runs it returns,
+            # and dropping the cache here would defeat it for every poll while runs are active.
+            return
+        project_path, is_run_path, _ = normalized.partition("/processing/")
+        if is_run_path and project_path.startswith("/projects/"):
+            self.invalidate_cache(f"{project_path}/processing")
+        elif normalized.startswith("/projects"):
+            self.invalidate_cache("/projects")
+        else:
+            self.invalidate_cache()
+
+    def _decode_response(self, response: requests.Response) -> Any:
         if response.status_code == 204 or not response.content:
             return None
 
@@ -121,6 +175,58 @@ class GMEManagementClient:
         except ValueError:
             return response.text
 
+    def _cached_get(self, path: str, *, params: dict[str, Any]) -> Any:
+        key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached.fetched_at < self.CACHE_TTL_SECONDS:
+                return cached.data
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = Future()
+                self._inflight[key] = pending
+                generation = self._cache_generation
+            else:
+                generation = None
+        if generation is None:
+            return pending.result()
+
+        try:
+            headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else {}
+            response = self._request_raw("GET", path, params=params, headers=headers, expected=(200, 304))
+            if response.status_code == 304 and cached is not None:
+                data = cached.data
+            else:
+                data = self._decode_response(response)
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._cache_lock:
+                if self._inflight.get(key) is pending:
+                    del self._inflight[key]
+
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = _CachedResponse(
+                    data=data,
+                    etag=response.headers.get("ETag"),
+                    fetched_at=time.monotonic(),
+                )
+        pending.set_result(data)
+        return data
+
+    def invalidate_cache(self, path_prefix: str | None = None) -> None:
+        with self._cache_lock:
+            if path_prefix is None:
+                self._cache.clear()
+                self._inflight.clear()
+            else:
+                for entries in (self._cache, self._inflight):
+                    for key in [key for key in entries if key[0].startswith(path_prefix)]:
+                        del entries[key]
+            self._cache_generation += 1
+
     def _build_error(self, response: requests.Response) -> ApiError:
         detail = f"HTTP {response.status_code}"
         code: str | None = None
@@ -145,7 +251,7 @@ class GMEManagementClient:
     ) -> Any:
         url = self._video_url(path)
         try:
-            response = requests.request(
+            response = self.service_session.request(
                 method=method,
                 url=url,
                 timeout=self.timeout_seconds,
@@ -186,7 +292,7 @@ class GMEManagementClient:
             headers["x-api-key"] = self.audio_service_api_key
         headers.setdefault("Accept", "application/json")
         try:
-            response = requests.request(
+            response = self.service_session.request(
                 method=method,
                 url=url,
                 timeout=self.timeout_seconds,
@@ -224,14 +330,17 @@ class GMEManagementClient:
                 domain=domain,
                 path="/",
             )
+            self.invalidate_cache()
             return
         self.session.cookies.set(self.session_cookie_name, token, path="/")
+        self.invalidate_cache()
 
     def get_session_token(self) -> str | None:
         return self.session.cookies.get(self.session_cookie_name)
 
     def clear_session_token(self) -> None:
         self.session.cookies.clear()
+        self.invalidate_cache()
 
     def register(self, *, login: str, password: str, email: str | None = None) -> dict[str, Any]:
         payload: dict[str, Any] = {"login": login, "password": password}
@@ -315,13 +424,25 @@ class GMEManagementClient:
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if q:
             params["q"] = q
-        data = self._request("GET", "/projects", params=params, expected=(200,))
+        data = self._cached_get("/projects", params=params)
         return ProjectsPage.from_api(data)
 
     def get_project(self, *, project_id: str) -> Project:
         data = self._request("GET", f"/projects/{project_id}", expected=(200,))
         return Project.from_api(data)
 
+    def get_project_bundle(self, *, project_id: str, run_id: str | None = None) -> ProjectBundle:
+        """Project, members, runs and (when the server resolves a run) its artifacts in one request."""
+        data = self._request(
+            "GET",
+            f"/projects/{project_id}/bundle",
+            params={"run_id": run_id} if run_id else None,
+            expected=(200,),
+        )
+        if not isinstance(data, dict) or not isinstance(data.get("project"), dict):
+            raise ApiError("Некорректный формат данных проекта")
+        return ProjectBundle.from_api(data)
+
     def get_processing_models(self) -> list[str]:
         data = self._request("GET", "/processing/models", expected=(200,))
         if not isinstance(data, list):
@@ -520,14 +641,24 @@ class GMEManagementClient:
         limit: int = 20,
         offset: int = 0,
     ) -> ProcessingRunsPage:
-        data = self._request(
-            "GET",
+        data = self._cached_get(
             f"/projects/{project_id}/processing",
             params={"limit": limit, "offset": offset},
-            expected=(200,),
         )
         return ProcessingRunsPage.from_api(data)
 
+    def list_latest_processing_runs(self, *, project_ids: list[str]) -> dict[UUID, ProcessingRun]:
+        data = self._request(
+            "GET",
+            "/processing/latest",
+            params={"project_ids": project_ids},
+            expected=(200,),
+        )
+        if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+            raise ApiError("Некорректный формат списка последних запусков")
+        runs = (ProcessingRun.from_api(item) for item in data["items"])
+        return {run.project_id: run for run in runs}
+
     def sync_processing_run(self, *, project_id: str, run_id: str) -> dict[str, Any]:
         return self._request(
             "POST",
@@ -535,6 +666,30 @@ class GMEManagementClient:
             expected=(200,),
         )
 
+    def sync_and_get_processing_run(self, *, project_id: str, run_id: str) -> ProcessingRun | None:
+        """Sync a run and return its updated state when the server echoes it back, else None."""
+        data = self.sync_processing_run(project_id=project_id, run_id=run_id)
+        if isinstance(data, dict) and isinstance(data.get("run"), dict):
+            data = data["run"]
+        if not isinstance(data, dict) or "id" not in data or "status" not in data:
+            return None
+        try:
+            return ProcessingRun.from_api(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def sync_processing_runs(self, *, run_ids: list[str]) -> dict[UUID, ProcessingRun]:
+        data = self._request(
+            "POST",
+            "/processing/sync",
+            json={"run_ids": run_ids},
+            expected=(200,),
+        )
+        if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+            raise ApiError("Некорректный формат ответа синхронизации запусков")
+        runs = (ProcessingRun.from_api(item) for item in data["items"])
+        return {run.id: run for run in runs}
+
     def cancel_processing_run(self, *, project_id: str, run_id: str) -> dict[str, Any]:
         return self._request(
             "POST",
@@ -609,6 +764,22 @@ class GMEManagementClient:
         )
         return ArtifactsList.from_api(data)
 
+    @staticmethod
+    def _stream_to_file(response: requests.Response, target_path: Path) -> Path:
+        # Download into a sibling .part file so an interrupted transfer never looks like a cached file.
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = target_path.with_name(f"{target_path.name}.part")
+        try:
+            with response, part_path.open("wb") as handle:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        handle.write(chunk)
+            os.replace(part_path, target_path)
+        except (OSError, requests.RequestException) as exc:
+            part_path.unlink(missing_ok=True)
+            raise ApiError("Не удалось сохранить загруженный файл.") from exc
+        return target_path
+
     def download_artifact(
         self,
         *,
@@ -628,12 +799,7 @@ class GMEManagementClient:
             expected=(200,),
             stream=True,
         )
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with target_path.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    handle.write(chunk)
-        return target_path
+        return self._stream_to_file(response, target_path)
 
     def download_project_video(self, *, project_id: str, target_path: Path) -> Path:
         response = self._request_raw(
@@ -642,9 +808,4 @@ class GMEManagementClient:
             expected=(200,),
             stream=True,
         )
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with target_path.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    handle.write(chunk)
-        return target_path
+        return self._stream_to_file(response, target_path)
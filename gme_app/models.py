@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
 
@@ -26,6 +28,7 @@ def parse_uuid(value: str | UUID | None) -> UUID | None:
         return None
 
 
+@lru_cache(maxsize=512)
 def format_datetime(value: datetime | None) -> str:
     if value is None:
         return "-"
@@ -71,6 +74,17 @@ class UserProfile:
             created_at=parse_datetime(payload.get("created_at")),
         )
 
+    def to_api(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "login": self.login,
+            "email": self.email,
+            "role": self.role,
+            "is_active": self.is_active,
+            "display_name": self.display_name,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
     @property
     def ui_name(self) -> str:
         return (self.display_name or self.login or "Пользователь").strip()
@@ -295,3 +309,24 @@ class ArtifactsList:
         return cls(
             artifacts=[Artifact.from_api(item) for item in payload.get("artifacts", [])],
         )
+
+
+@dataclass(slots=True)
+class ProjectBundle:
+    project: Project
+    members: ProjectMembersPage
+    runs: ProcessingRunsPage
+    artifacts_run_id: str | None
+    artifacts: ArtifactsList | None
+
+    @classmethod
+    def from_api(cls, payload: dict) -> "ProjectBundle":
+        artifacts = payload.get("artifacts")
+        artifacts_run_id = payload.get("run_id")
+        return cls(
+            project=Project.from_api(payload["project"]),
+            members=ProjectMembersPage.from_api(payload.get("members") or {}),
+            runs=ProcessingRunsPage.from_api(payload.get("runs") or {}),
+            artifacts_run_id=str(artifacts_run_id) if artifacts_run_id else None,
+            artifacts=ArtifactsList.from_api(artifacts) if isinstance(artifacts, dict) else None,
+        )
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 
 @dataclass(slots=True)
@@ -12,38 +15,70 @@ class PersistedSession:
     api_base_url: str
     session_token: str
     user_login: str
+    user_profile: dict[str, Any] | None = None
 
 
 class SessionStore:
     def __init__(self, file_path: Path) -> None:
         self.file_path = file_path
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Bumped by clear(); a background save taken before the bump must not resurrect the file.
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def load(self) -> PersistedSession | None:
-        if not self.file_path.exists():
+        try:
+            raw = self.file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            self.clear()
             return None
         try:
-            payload = json.loads(self.file_path.read_text(encoding="utf-8"))
+            payload = json.loads(raw)
+            user_profile = payload.get("user_profile")
             return PersistedSession(
                 api_base_url=str(payload["api_base_url"]),
                 session_token=str(payload["session_token"]),
                 user_login=str(payload.get("user_login", "")),
+                user_profile=user_profile if isinstance(user_profile, dict) else None,
             )
-        except (json.JSONDecodeError, KeyError, OSError, TypeError):
+        except (AttributeError, KeyError, TypeError, ValueError):
             self.clear()
             return None
 
-    def save(self, *, api_base_url: str, session_token: str, user_login: str) -> None:
+    def save(
+        self,
+        *,
+        api_base_url: str,
+        session_token: str,
+        user_login: str,
+        user_profile: dict[str, Any] | None = None,
+        generation: int | None = None,
+    ) -> None:
         payload = {
             "api_base_url": api_base_url,
             "session_token": session_token,
             "user_login": user_login,
+            "user_profile": user_profile,
         }
-        self.file_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # Write next to the target and swap it in, so a crash never leaves a half-written session file.
+        tmp_path = self.file_path.with_name(f"{self.file_path.name}.tmp")
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            tmp_path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.file_path)
 
     def clear(self) -> None:
-        if self.file_path.exists():
-            self.file_path.unlink(missing_ok=True)
+        with self._lock:
+            self._generation += 1
+            if self.file_path.exists():
+                self.file_path.unlink(missing_ok=True)
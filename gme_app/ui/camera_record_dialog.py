@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
+from time import monotonic_ns, strftime
 
 from PyQt6.QtCore import QTimer, QUrl
 from PyQt6.QtMultimedia import QCamera, QMediaCaptureSession, QMediaDevices, QMediaFormat, QMediaRecorder
@@ -176,7 +176,7 @@ class CameraRecordDialog(QDialog):
             self.stop_button.setEnabled(True)
             self.use_button.setEnabled(False)
             self.status_label.setText("Идет запись...")
-            self._started_at_ms = int(datetime.now().timestamp() * 1000)
+            self._started_at_ms = monotonic_ns() // 1_000_000
             self.timer.start()
             return
 
@@ -199,7 +199,7 @@ class CameraRecordDialog(QDialog):
             QMessageBox.warning(self, "Камера", "Камера недоступна")
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = strftime("%Y%m%d_%H%M%S")
         self._record_target_path = self.output_dir / f"camera_capture_{timestamp}.mp4"
         self.recorded_path = None
         self.recorder.setOutputLocation(QUrl.fromLocalFile(str(self._record_target_path)))
@@ -214,7 +214,7 @@ class CameraRecordDialog(QDialog):
             self.duration_label.setText("00:00")
             return
 
-        elapsed_sec = max(0, (int(datetime.now().timestamp() * 1000) - self._started_at_ms) // 1000)
+        elapsed_sec = max(0, (monotonic_ns() // 1_000_000 - self._started_at_ms) // 1000)
         minutes = elapsed_sec // 60
         seconds = elapsed_sec % 60
         self.duration_label.setText(f"{minutes:02d}:{seconds:02d}")
@@ -2,10 +2,15 @@
 
 from __future__ import annotations 
 
+from collections .abc import Callable 
 from dataclasses import dataclass 
+from itertools import islice 
+from operator import itemgetter 
 from pathlib import Path 
+from uuid import UUID 
 
-from PyQt6 .QtCore import Qt ,pyqtSignal 
+from PyQt6 import sip 
+from PyQt6 .QtCore import QAbstractTableModel ,QModelIndex ,QSignalBlocker ,Qt ,QThreadPool ,QTimer ,pyqtSignal 
 from PyQt6 .QtGui import QColor ,QBrush 
 from PyQt6 .QtWidgets import (
 QBoxLayout ,
@@ -22,8 +27,7 @@ QLineEdit ,
 QPushButton ,
 QScrollArea ,
 QSizePolicy ,
-QTableWidget ,
-QTableWidgetItem ,
+QTableView ,
 QTextEdit ,
 QVBoxLayout ,
 QWidget ,
@@ -32,6 +36,20 @@ QWidget ,
 from gme_app .models import AudioProvider ,ProcessingRun ,Project ,UserProfile ,format_datetime 
 from gme_app .ui .camera_record_dialog import CameraRecordDialog 
 from gme_app .ui .widgets import MetricCard ,ProjectCard ,ResponsiveGrid ,run_status_label 
+from gme_app .workers import Worker 
+
+_ACTIVE_PROJECT_STATUSES =frozenset ({"draft","in_progress"})
+_CARD_BATCH_SIZE =12 
+_ANALYSIS_SCOPES =frozenset ({"emotions_only","lie_only","emotions_and_lie"})
+_EMOTION_SCOPES =frozenset ({"emotions_only","emotions_and_lie"})
+_LIE_SCOPES =frozenset ({"lie_only","emotions_and_lie"})
+_LIE_PROCESSING_MODES =frozenset ({"video_only","audio_only","audio_and_video"})
+_NO_AUDIO_PROVIDER =frozenset ({"","__none__"})
+_AUDIO_PROVIDERS_BY_MODE :dict [str ,tuple [str ,...]]={
+"audio_only":("native","lie_detection"),
+"video_only":("lie_to_me",),
+"audio_and_video":("lie_to_me",),
+}
 
 
 @dataclass (slots =True )
@@ -61,10 +79,12 @@ class CreateProjectDialog (QDialog ):
         self .setModal (True )
         self .resize (680 ,470 )
 
-        self .models =[item .strip ()for item in models if item .strip ()]
-        self .detectors =[item .strip ()for item in detectors if item .strip ()]
+        self .models =[name for name in (item .strip ()for item in models )if name ]
+        self .detectors =[name for name in (item .strip ()for item in detectors )if name ]
         self .audio_providers =[item for item in audio_providers if item .code ]
         self .camera_output_dir =camera_output_dir 
+        self ._exists_worker :Worker |None =None 
+        self ._audio_provider_mode :str |None =None 
         self ._build_ui ()
 
     def _build_ui (self )->None :
@@ -106,6 +126,12 @@ class CreateProjectDialog (QDialog ):
 
         audio_provider_label =QLabel ("Аудио-провайдер")
         self .audio_provider_combo =QComboBox ()
+        providers_by_code ={item .code :item for item in self .audio_providers }
+        for code in dict .fromkeys (code for codes in _AUDIO_PROVIDERS_BY_MODE .values ()for code in codes ):
+            provider =providers_by_code .get (code )
+            if provider is not None :
+                self .audio_provider_combo .addItem (provider .title ,provider .code )
+        self .audio_provider_combo .addItem ("Нет подходящих провайдеров","__none__")
 
         video_label =QLabel ("Видео")
         file_row =QHBoxLayout ()
@@ -168,6 +194,18 @@ class CreateProjectDialog (QDialog ):
         layout .addWidget (self .button_box )
         self ._on_processing_mode_changed ()
 
+    def reset (self )->None :
+        self .title_input .clear ()
+        self .description_input .clear ()
+        self .video_input .clear ()
+        self .start_processing_checkbox .setChecked (True )
+        self .error_label .hide ()
+        for combo in (self .analysis_scope_combo ,self .model_combo ,self .detector_combo ,self .processing_mode_combo ):
+            with QSignalBlocker (combo ):
+                combo .setCurrentIndex (0 )
+        self .audio_provider_combo .setCurrentIndex (-1 )
+        self ._on_processing_mode_changed ()
+
     def _browse_video (self )->None :
         file_path ,_ =QFileDialog .getOpenFileName (
         self ,
@@ -185,16 +223,20 @@ class CreateProjectDialog (QDialog ):
 
     def _current_analysis_scope (self )->str :
         scope =str (self .analysis_scope_combo .currentData ()or "emotions_only").strip ().lower ()
-        if scope in {"emotions_only","lie_only","emotions_and_lie"}:
+        if scope in _ANALYSIS_SCOPES :
             return scope
         return "emotions_only"
 
     def _current_lie_processing_mode (self )->str :
         mode =str (self .processing_mode_combo .currentData ()or "audio_only").strip ().lower ()
-        if mode in {"video_only","audio_only","audio_and_video"}:
+        if mode in _LIE_PROCESSING_MODES :
             return mode
         return "audio_only"
 
+    def _current_audio_provider (self )->str :
+        code =str (self .audio_provider_combo .currentData ()or "").strip ().lower ()
+        return ""if code in _NO_AUDIO_PROVIDER else code 
+
     def _resolved_processing_mode (self )->str :
         scope =self ._current_analysis_scope ()
         if scope =="emotions_only":
@@ -209,29 +251,53 @@ class CreateProjectDialog (QDialog ):
         video_path =self .video_input .text ().strip ()
         model_name =self .model_combo .currentText ().strip ()
         detector_name =str (self .detector_combo .currentData ()or "").strip ().lower ()
-        audio_provider_raw =str (self .audio_provider_combo .currentData ()or "").strip ().lower ()
+        audio_provider =self ._current_audio_provider ()
 
         if len (title )<3 :
             self ._show_error ("Название должно содержать минимум 3 символа.")
             return 
-        if scope in {"emotions_only","emotions_and_lie"}and not model_name :
+        if scope in _EMOTION_SCOPES and not model_name :
             self ._show_error ("Выберите модель анализа.")
             return 
         if not video_path :
             self ._show_error ("Выберите видеофайл.")
             return 
-        if scope in {"emotions_only","emotions_and_lie"}and not detector_name :
+        if scope in _EMOTION_SCOPES and not detector_name :
             self ._show_error ("Выберите детектор лица.")
             return 
-        if scope in {"lie_only","emotions_and_lie"}and audio_provider_raw in {"","__none__"}:
+        if scope in _LIE_SCOPES and not audio_provider :
             self ._show_error ("Для этого режима нет подходящего аудио-провайдера.")
             return 
-        if not Path (video_path ).exists ():
+        if self ._exists_worker is not None :
+            return 
+
+        # The file may live on a slow or network mount, so stat it off the GUI thread.
+        worker =Worker (Path (video_path ).exists )
+        worker .signals .result .connect (lambda exists :self ._on_video_checked (video_path ,bool (exists )))
+        worker .signals .error .connect (lambda _exc :self ._on_video_checked (video_path ,False ))
+        self ._exists_worker =worker 
+        self ._set_accept_enabled (False )
+        QThreadPool .globalInstance ().start (worker )
+
+    def _on_video_checked (self ,video_path :str ,exists :bool )->None :
+        # The cached dialog may have been deleted while the check was running; the lambdas still hold the wrapper.
+        if sip .isdeleted (self ):
+            return 
+        self ._exists_worker =None 
+        self ._set_accept_enabled (True )
+        if not self .isVisible ()or self .video_input .text ().strip ()!=video_path :
+            return 
+        if not exists :
             self ._show_error ("Выбранный видеофайл не найден.")
             return 
 
         self .accept ()
 
+    def _set_accept_enabled (self ,enabled :bool )->None :
+        ok_button =self .button_box .button (QDialogButtonBox .StandardButton .Ok )
+        if ok_button :
+            ok_button .setEnabled (enabled )
+
     def _show_error (self ,message :str )->None :
         self .error_label .setText (message )
         self .error_label .show ()
@@ -240,46 +306,45 @@ class CreateProjectDialog (QDialog ):
         scope =self ._current_analysis_scope ()
         lie_mode =self ._current_lie_processing_mode ()
 
-        emotion_enabled =scope in {"emotions_only","emotions_and_lie"}
-        lie_enabled =scope in {"lie_only","emotions_and_lie"}
+        emotion_enabled =scope in _EMOTION_SCOPES 
+        lie_enabled =scope in _LIE_SCOPES 
         self ._refresh_audio_providers_for_mode (lie_mode )
         self .model_combo .setEnabled (emotion_enabled )
         self .detector_combo .setEnabled (emotion_enabled )
         self .processing_mode_combo .setEnabled (lie_enabled )
-        has_compatible_audio_provider =str (self .audio_provider_combo .currentData ()or "")!="__none__"
-        self .audio_provider_combo .setEnabled (lie_enabled and has_compatible_audio_provider )
+        self .audio_provider_combo .setEnabled (lie_enabled and bool (self ._current_audio_provider ()))
 
     def _refresh_audio_providers_for_mode (self ,mode :str )->None :
-        selected_code =str (self .audio_provider_combo .currentData ()or "").strip ().lower ()
-        self .audio_provider_combo .blockSignals (True )
-        self .audio_provider_combo .clear ()
-
         normalized_mode =str (mode or "").strip ().lower ()or "audio_only"
-        providers_by_code ={item .code :item for item in self .audio_providers }
-        allowed_by_mode :dict [str ,tuple [str ,...]]={
-        "audio_only":("native","lie_detection"),
-        "video_only":("lie_to_me",),
-        "audio_and_video":("lie_to_me",),
-        }
-        allowed_codes =allowed_by_mode .get (normalized_mode ,allowed_by_mode ["audio_only"])
-        providers =[providers_by_code [code ]for code in allowed_codes if code in providers_by_code ]
-
-        for provider in providers :
-            self .audio_provider_combo .addItem (provider .title ,provider .code )
-
-        if self .audio_provider_combo .count ()==0 :
-            self .audio_provider_combo .addItem ("Нет подходящих провайдеров","__none__")
-
-        if selected_code :
-            selected_index =self .audio_provider_combo .findData (selected_code )
-            if selected_index >=0 :
-                self .audio_provider_combo .setCurrentIndex (selected_index )
-
-        self .audio_provider_combo .blockSignals (False )
+        combo =self .audio_provider_combo 
+        if normalized_mode ==self ._audio_provider_mode and combo .currentIndex ()>=0 :
+            return 
+        self ._audio_provider_mode =normalized_mode 
+        allowed_codes =_AUDIO_PROVIDERS_BY_MODE .get (normalized_mode ,_AUDIO_PROVIDERS_BY_MODE ["audio_only"])
+        view =combo .view ()
+        model =combo .model ()
+
+        # The last item is the "no provider" placeholder; it is only shown when nothing else fits.
+        placeholder_index =combo .count ()-1 
+        fallback_index =-1 
+        for index in range (placeholder_index ):
+            allowed =combo .itemData (index )in allowed_codes 
+            view .setRowHidden (index ,not allowed )
+            model .item (index ).setEnabled (allowed )
+            if allowed and fallback_index <0 :
+                fallback_index =index 
+        view .setRowHidden (placeholder_index ,fallback_index >=0 )
+        model .item (placeholder_index ).setEnabled (fallback_index <0 )
+        if fallback_index <0 :
+            fallback_index =placeholder_index 
+
+        current_index =combo .currentIndex ()
+        if current_index <0 or view .isRowHidden (current_index ):
+            combo .setCurrentIndex (fallback_index )
 
     def payload (self )->CreateProjectPayload :
         scope =self ._current_analysis_scope ()
-        emotions_enabled =scope in {"emotions_only","emotions_and_lie"}
+        emotions_enabled =scope in _EMOTION_SCOPES 
         model_name =self .model_combo .currentText ().strip ()if emotions_enabled else ""
         detector_name =str (self .detector_combo .currentData ()or "").strip ().lower ()if emotions_enabled else ""
         return CreateProjectPayload (
@@ -290,14 +355,61 @@ class CreateProjectDialog (QDialog ):
         model_name =model_name ,
         detector_name =detector_name ,
         processing_mode =self ._resolved_processing_mode (),
-        audio_provider =(
-        ""
-        if str (self .audio_provider_combo .currentData ()or "").strip ().lower ()in {"","__none__"}
-        else str (self .audio_provider_combo .currentData ()or "").strip ().lower ()
-        ),
+        audio_provider =self ._current_audio_provider (),
         )
 
 
+class RunsTableModel (QAbstractTableModel ):
+    HEADERS =("Проект","Статус","Создан","Обновлен","Провайдер")
+    _status_brushes :dict [str ,QBrush ]={}
+
+    def __init__ (self ,status_color :Callable [[str ],QColor ],parent :QWidget |None =None )->None :
+        super ().__init__ (parent )
+        self ._status_color =status_color 
+        self ._rows :list [tuple [Project ,ProcessingRun |None ]]=[]
+
+    def set_rows (self ,rows :list [tuple [Project ,ProcessingRun |None ]])->None :
+        self .beginResetModel ()
+        self ._rows =rows 
+        self .endResetModel ()
+
+    def rowCount (self ,parent :QModelIndex =QModelIndex ())->int :# type: ignore[override]
+        return 0 if parent .isValid ()else len (self ._rows )
+
+    def columnCount (self ,parent :QModelIndex =QModelIndex ())->int :# type: ignore[override]
+        return 0 if parent .isValid ()else len (self .HEADERS )
+
+    def headerData (self ,section :int ,orientation :Qt .Orientation ,role :int =Qt .ItemDataRole .DisplayRole ):# type: ignore[override]
+        if role ==Qt .ItemDataRole .DisplayRole and orientation ==Qt .Orientation .Horizontal :
+            return self .HEADERS [section ]
+        return None 
+
+    def data (self ,index :QModelIndex ,role :int =Qt .ItemDataRole .DisplayRole ):# type: ignore[override]
+        if not index .isValid ():
+            return None 
+        project ,run =self ._rows [index .row ()]
+        column =index .column ()
+        if role ==Qt .ItemDataRole .DisplayRole :
+            if column ==0 :
+                return project .title 
+            if column ==1 :
+                return run_status_label (run .status )if run else "Нет запусков"
+            if column ==2 :
+                return format_datetime (run .created_at if run else None )
+            if column ==3 :
+                return format_datetime (run .updated_at if run else project .updated_at )
+            if column ==4 :
+                return run .provider if run else "-"
+            return None 
+        if role ==Qt .ItemDataRole .ForegroundRole and column ==1 and run :
+            brush =self ._status_brushes .get (run .status )
+            if brush is None :
+                brush =QBrush (self ._status_color (run .status ))
+                self ._status_brushes [run .status ]=brush 
+            return brush 
+        return None 
+
+
 class DashboardView (QWidget ):
     refresh_requested =pyqtSignal ()
     logout_requested =pyqtSignal ()
@@ -306,15 +418,48 @@ class DashboardView (QWidget ):
     open_profile_requested =pyqtSignal ()
     open_admin_requested =pyqtSignal ()
 
+    _STATUS_COLORS :dict [str ,QColor ]={
+    "scheduled":QColor ("#2f5cb1"),
+    "pending":QColor ("#6f50b5"),
+    "running":QColor ("#996f00"),
+    "completed":QColor ("#1f7c4a"),
+    "failed":QColor ("#bb334a"),
+    "cancelled":QColor ("#566084"),
+    }
+    _DEFAULT_STATUS_COLOR =QColor ("#4d5a84")
+
     def __init__ (self ,parent :QWidget |None =None )->None :
         super ().__init__ (parent )
         self ._all_projects :list [Project ]=[]
-        self ._runs_by_project :dict [str ,ProcessingRun |None ]={}
+        self ._search_index :list [tuple [Project ,str ]]=[]
+        self ._card_pool :dict [UUID ,ProjectCard ]={}
+        self ._empty_state :QFrame |None =None 
+        self ._create_dialog :CreateProjectDialog |None =None 
+        self ._create_dialog_key :tuple [object ,...]|None =None 
+        self ._runs_by_project :dict [UUID ,ProcessingRun |None ]={}
+        self ._sorted_runs :list [tuple [Project ,ProcessingRun |None ]]=[]
         self ._models :list [str ]=[]
         self ._detectors :list [str ]=[]
         self ._audio_providers :list [AudioProvider ]=[]
         self ._camera_output_dir =Path .cwd ()/"captures"
         self ._is_admin =False 
+        self ._last_responsive_state :tuple [bool ,bool ,int ]|None =None 
+        self ._active_nav_key :str |None =None 
+        self ._filter_timer =QTimer (self )
+        self ._filter_timer .setSingleShot (True )
+        self ._filter_timer .setInterval (120 )
+        self ._filter_timer .timeout .connect (self ._apply_filter )
+        self ._resize_timer =QTimer (self )
+        self ._resize_timer .setSingleShot (True )
+        self ._resize_timer .setInterval (50 )
+        self ._resize_timer .timeout .connect (self ._apply_responsive_mode )
+        self ._pending_card_projects :list [Project ]=[]
+        # Index of the first card the pending batch still has to build or relabel.
+        self ._pending_card_offset =0 
+        self ._card_batch_timer =QTimer (self )
+        self ._card_batch_timer .setSingleShot (True )
+        self ._card_batch_timer .setInterval (0 )
+        self ._card_batch_timer .timeout .connect (self ._render_next_card_batch )
         self ._build_ui ()
         self ._apply_responsive_mode ()
         self .set_active_nav ("projects")
@@ -380,27 +525,41 @@ class DashboardView (QWidget ):
         runs_title .setObjectName ("SectionTitle")
         content_layout .addWidget (runs_title )
 
-        self .runs_table =QTableWidget (0 ,5 )
-        self .runs_table .setObjectName ("RunsTable")
-        self .runs_table .setHorizontalHeaderLabels (["Проект","Статус","Создан","Обновлен","Провайдер"])
-        self .runs_table .verticalHeader ().setVisible (False )
-        self .runs_table .setAlternatingRowColors (False )
-        self .runs_table .setSelectionBehavior (QTableWidget .SelectionBehavior .SelectRows )
-        self .runs_table .setSelectionMode (QTableWidget .SelectionMode .NoSelection )
-        self .runs_table .setEditTriggers (QTableWidget .EditTrigger .NoEditTriggers )
-        self .runs_table .setMinimumHeight (240 )
-        self .runs_table .setSizePolicy (QSizePolicy .Policy .Expanding ,QSizePolicy .Policy .Expanding )
-        header_view =self .runs_table .horizontalHeader ()
+        self ._runs_model =RunsTableModel (self ._status_color ,self )
+        self .runs_table :QTableView |None =None 
+        self ._runs_placeholder =QWidget ()
+        self ._runs_placeholder .setMinimumHeight (240 )
+        self ._content_layout =content_layout 
+        content_layout .addWidget (self ._runs_placeholder ,1 )
+        self .content_scroll .setWidget (content )
+        main_layout .addWidget (self .content_scroll ,1 )
+
+        root .addWidget (self .main_panel ,1 )
+
+    def _ensure_runs_table (self )->QTableView :
+        if self .runs_table is not None :
+            return self .runs_table 
+
+        runs_table =QTableView ()
+        runs_table .setObjectName ("RunsTable")
+        runs_table .setModel (self ._runs_model )
+        runs_table .verticalHeader ().setVisible (False )
+        runs_table .setAlternatingRowColors (False )
+        runs_table .setSelectionBehavior (QTableView .SelectionBehavior .SelectRows )
+        runs_table .setSelectionMode (QTableView .SelectionMode .NoSelection )
+        runs_table .setEditTriggers (QTableView .EditTrigger .NoEditTriggers )
+        runs_table .setMinimumHeight (240 )
+        runs_table .setSizePolicy (QSizePolicy .Policy .Expanding ,QSizePolicy .Policy .Expanding )
+        header_view =runs_table .horizontalHeader ()
         header_view .setSectionResizeMode (0 ,QHeaderView .ResizeMode .Stretch )
         header_view .setSectionResizeMode (1 ,QHeaderView .ResizeMode .ResizeToContents )
         header_view .setSectionResizeMode (2 ,QHeaderView .ResizeMode .ResizeToContents )
         header_view .setSectionResizeMode (3 ,QHeaderView .ResizeMode .ResizeToContents )
         header_view .setSectionResizeMode (4 ,QHeaderView .ResizeMode .ResizeToContents )
-        content_layout .addWidget (self .runs_table ,1 )
-        self .content_scroll .setWidget (content )
-        main_layout .addWidget (self .content_scroll ,1 )
-
-        root .addWidget (self .main_panel ,1 )
+        self ._content_layout .replaceWidget (self ._runs_placeholder ,runs_table )
+        self ._runs_placeholder .deleteLater ()
+        self .runs_table =runs_table 
+        return runs_table 
 
     def _build_sidebar (self )->QWidget :
         sidebar =QFrame ()
@@ -419,19 +578,10 @@ class DashboardView (QWidget ):
         nav_data :list [tuple [str ,str ,str ,object ]]=[
         ("projects","Проекты","ПР",self ._on_open_projects_clicked ),
         ("profile","Профиль","ПФ",self .open_profile_requested .emit ),
-        ("admin","Админ","АД",self .open_admin_requested .emit ),
         ]
         for key ,full_text ,compact_text ,handler in nav_data :
-            button =QPushButton (full_text )
-            button .setObjectName ("SidebarNavButton")
-            button .setProperty ("active","false")
-            button .setProperty ("fullText",full_text )
-            button .setProperty ("compactText",compact_text )
-            button .setProperty ("viewKey",key )
-            button .clicked .connect (handler )
-            self .sidebar_buttons .append (button )
-            self ._nav_buttons_by_key [key ]=button 
-            layout .addWidget (button )
+            layout .addWidget (self ._create_nav_button (key ,full_text ,compact_text ,handler ))
+        self ._sidebar_layout =layout 
 
         layout .addStretch (1 )
 
@@ -448,6 +598,18 @@ class DashboardView (QWidget ):
         layout .addWidget (self .sidebar_logout_button )
         return sidebar 
 
+    def _create_nav_button (self ,key :str ,full_text :str ,compact_text :str ,handler :object )->QPushButton :
+        button =QPushButton (full_text )
+        button .setObjectName ("SidebarNavButton")
+        button .setProperty ("active","false")
+        button .setProperty ("fullText",full_text )
+        button .setProperty ("compactText",compact_text )
+        button .setProperty ("viewKey",key )
+        button .clicked .connect (handler )
+        self .sidebar_buttons .append (button )
+        self ._nav_buttons_by_key [key ]=button 
+        return button 
+
     def _build_header (self )->QWidget :
         frame =QFrame ()
         frame .setObjectName ("HeaderBar")
@@ -470,7 +632,7 @@ class DashboardView (QWidget ):
 
         self .search_input =QLineEdit ()
         self .search_input .setPlaceholderText ("Поиск по названию или описанию")
-        self .search_input .textChanged .connect (self ._apply_filter )
+        self .search_input .textChanged .connect (self ._schedule_filter )
         self .search_input .setMinimumWidth (250 )
 
         self .models_label =QLabel ("Модели: -")
@@ -494,14 +656,14 @@ class DashboardView (QWidget ):
         return frame 
 
     def set_models (self ,models :list [str ])->None :
-        self ._models =[item .strip ()for item in models if item .strip ()]
+        self ._models =[name for name in (item .strip ()for item in models )if name ]
         if self ._models :
             self .models_label .setText (f"Модели: {len (self ._models )}")
         else :
             self .models_label .setText ("Модели: недоступны")
 
     def set_detectors (self ,detectors :list [str ])->None :
-        self ._detectors =[item .strip ()for item in detectors if item .strip ()]
+        self ._detectors =[name for name in (item .strip ()for item in detectors )if name ]
 
     def set_audio_providers (self ,providers :list [AudioProvider ])->None :
         self ._audio_providers =[item for item in providers if item .code ]
@@ -516,13 +678,28 @@ class DashboardView (QWidget ):
             is_error =True ,
             )
 
-        dialog =CreateProjectDialog (
-        models =self ._models ,
-        detectors =self ._detectors ,
-        audio_providers =self ._audio_providers ,
-        camera_output_dir =self ._camera_output_dir ,
-        parent =self ,
+        dialog_key =(
+        tuple (self ._models ),
+        tuple (self ._detectors ),
+        tuple (self ._audio_providers ),
+        self ._camera_output_dir ,
         )
+        dialog =self ._create_dialog 
+        if dialog is None or self ._create_dialog_key !=dialog_key :
+            if dialog is not None :
+                dialog .deleteLater ()
+            dialog =CreateProjectDialog (
+            models =self ._models ,
+            detectors =self ._detectors ,
+            audio_providers =self ._audio_providers ,
+            camera_output_dir =self ._camera_output_dir ,
+            parent =self ,
+            )
+            self ._create_dialog =dialog 
+            self ._create_dialog_key =dialog_key 
+        else :
+            dialog .reset ()
+
         if dialog .exec ()==QDialog .DialogCode .Accepted :
             payload =dialog .payload ()
             self .create_project_requested .emit (
@@ -562,12 +739,28 @@ class DashboardView (QWidget ):
     def set_admin_mode (self ,is_admin :bool )->None :
         self ._is_admin =is_admin 
         admin_button =self ._nav_buttons_by_key .get ("admin")
-        if admin_button is not None :
-            admin_button .setVisible (is_admin )
+        if admin_button is None :
+            if not is_admin :
+                return 
+            # Built on the first admin session only.
+            admin_button =self ._create_nav_button ("admin","Админ","АД",self .open_admin_requested .emit )
+            self ._sidebar_layout .insertWidget (self ._sidebar_layout .indexOf (self ._nav_buttons_by_key ["profile"])+1 ,admin_button )
+            if self ._last_responsive_state is not None and self ._last_responsive_state [0 ]:
+                admin_button .setText ("АД")
+                admin_button .setToolTip ("Админ")
+            if self ._active_nav_key =="admin":
+                admin_button .setProperty ("active","true")
+        admin_button .setVisible (is_admin )
 
     def set_active_nav (self ,view_key :str )->None :
+        if view_key ==self ._active_nav_key :
+            return 
+        self ._active_nav_key =view_key 
         for key ,button in self ._nav_buttons_by_key .items ():
-            button .setProperty ("active","true"if key ==view_key else "false")
+            active ="true"if key ==view_key else "false"
+            if button .property ("active")==active :
+                continue 
+            button .setProperty ("active",active )
             button .style ().unpolish (button )
             button .style ().polish (button )
 
@@ -579,39 +772,91 @@ class DashboardView (QWidget ):
     projects :list [Project ],
     runs :list [tuple [Project ,ProcessingRun |None ]],
     )->None :
-        self ._all_projects =list (projects )
-        self ._runs_by_project ={str (project .id ):run for project ,run in runs }
+        self ._all_projects =projects 
+        self ._search_index =[
+        (project ,f"{project .title }\x00{project .description or ''}".lower ())
+        for project in self ._all_projects 
+        ]
+        self ._ensure_runs_table ()
+        self ._runs_by_project ={project .id :run for project ,run in runs }
+        # Float keys: server timestamps may be naive or aware, and the two cannot be compared directly.
+        keyed =[
+        (moment .timestamp ()if moment else 0.0 ,project ,run )
+        for project in self ._all_projects 
+        for run in (self ._runs_by_project .get (project .id ),)
+        for moment in (run .created_at if run else project .updated_at ,)
+        ]
+        keyed .sort (key =itemgetter (0 ),reverse =True )
+        self ._sorted_runs =[(project ,run )for _ ,project ,run in keyed ]
+        live_ids ={project .id for project in self ._all_projects }
+        for project_id in [key for key in self ._card_pool if key not in live_ids ]:
+            self ._card_pool .pop (project_id ).deleteLater ()
         self ._refresh_metrics ()
         self ._apply_filter ()
 
     def _refresh_metrics (self )->None :
         total =len (self ._all_projects )
-        active =sum (1 for project in self ._all_projects if project .status in {"draft","in_progress"})
-        done =sum (1 for project in self ._all_projects if project .status =="done")
-        with_runs =sum (1 for project in self ._all_projects if self ._runs_by_project .get (str (project .id ))is not None )
+        active =done =with_runs =0 
+        for project in self ._all_projects :
+            if project .status in _ACTIVE_PROJECT_STATUSES :
+                active +=1 
+            elif project .status =="done":
+                done +=1 
+            if self ._runs_by_project .get (project .id )is not None :
+                with_runs +=1 
 
         self .total_metric .set_value (str (total ))
         self .active_metric .set_value (str (active ))
         self .done_metric .set_value (str (done ))
         self .runs_metric .set_value (str (with_runs ))
 
+    def _schedule_filter (self ,*_ :object )->None :
+        self ._filter_timer .start ()
+
     def _apply_filter (self ,*_ :object )->None :
+        self ._filter_timer .stop ()
         query =self .search_input .text ().strip ().lower ()
         if not query :
-            projects =list (self ._all_projects )
+            projects =self ._all_projects 
         else :
-            projects =[
-            project 
-            for project in self ._all_projects 
-            if query in project .title .lower ()or query in (project .description or "").lower ()
-            ]
+            projects =[project for project ,corpus in self ._search_index if query in corpus ]
 
         self ._render_project_cards (projects )
         self ._render_runs_table (projects )
 
-    def _render_project_cards (self ,projects :list [Project ])->None :
+    def _render_project_cards (self ,projects :list [Project ],*,start :int =0 )->None :
+        self ._card_batch_timer .stop ()
+        self ._pending_card_projects =projects 
         items :list [QWidget ]=[]
         if not projects :
+            items .append (self ._empty_state_widget ())
+        else :
+            created =0 
+            for index ,project in enumerate (projects ):
+                project_id =project .id 
+                card =self ._card_pool .get (project_id )
+                if card is None :
+                    if created ==_CARD_BATCH_SIZE :
+                        # Let the event loop paint what is ready before building the next batch of cards.
+                        self ._pending_card_offset =index 
+                        self ._card_batch_timer .start ()
+                        break 
+                    created +=1 
+                    card =ProjectCard (project )
+                    card .open_project_requested .connect (self .open_project_requested .emit )
+                    self ._card_pool [project_id ]=card 
+                elif index >=start :
+                    # Cards before ``start`` were already relabelled by an earlier batch of this render.
+                    card .update_project (project )
+                items .append (card )
+
+        self .projects_grid .set_items (items ,dispose_removed =False )
+
+    def _render_next_card_batch (self )->None :
+        self ._render_project_cards (self ._pending_card_projects ,start =self ._pending_card_offset )
+
+    def _empty_state_widget (self )->QFrame :
+        if self ._empty_state is None :
             empty =QFrame ()
             empty .setObjectName ("EmptyState")
             empty_layout =QVBoxLayout (empty )
@@ -624,63 +869,50 @@ class DashboardView (QWidget ):
             empty_layout .addWidget (title )
             empty_layout .addWidget (hint )
             empty_layout .addStretch (1 )
-            items .append (empty )
-        else :
-            for project in projects :
-                card =ProjectCard (project )
-                card .open_project_requested .connect (self .open_project_requested .emit )
-                items .append (card )
-
-        self .projects_grid .set_items (items )
+            self ._empty_state =empty 
+        return self ._empty_state 
 
     def _render_runs_table (self ,projects :list [Project ])->None :
-        rows :list [tuple [Project ,ProcessingRun |None ]]=[]
-        for project in projects :
-            rows .append ((project ,self ._runs_by_project .get (str (project .id ))))
-
-        def sort_key (item :tuple [Project ,ProcessingRun |None ])->float :
-            run =item [1 ]
-            dt =run .created_at if run else item [0 ].updated_at 
-            return dt .timestamp ()if dt else 0.0 
-
-        rows .sort (key =sort_key ,reverse =True )
-        rows =rows [:20 ]
-
-        self .runs_table .setRowCount (len (rows ))
-        for row_index ,(project ,run )in enumerate (rows ):
-            status_value =run .status if run else "-"
-            status_text =run_status_label (status_value )if run else "Нет запусков"
-            status_item =QTableWidgetItem (status_text )
-            if run :
-                status_color =self ._status_color (run .status )
-                status_item .setForeground (QBrush (status_color ))
-
-            self .runs_table .setItem (row_index ,0 ,QTableWidgetItem (project .title ))
-            self .runs_table .setItem (row_index ,1 ,status_item )
-            self .runs_table .setItem (row_index ,2 ,QTableWidgetItem (format_datetime (run .created_at if run else None )))
-            self .runs_table .setItem (
-            row_index ,
-            3 ,
-            QTableWidgetItem (format_datetime (run .updated_at if run else project .updated_at )),
-            )
-            self .runs_table .setItem (row_index ,4 ,QTableWidgetItem (run .provider if run else "-"))
+        if len (projects )==len (self ._all_projects ):
+            rows =self ._sorted_runs [:20 ]
+        else :
+            visible ={project .id for project in projects }
+            rows =list (islice ((row for row in self ._sorted_runs if row [0 ].id in visible ),20 ))
+
+        self ._runs_model .set_rows (rows )
 
     def _status_color (self ,status :str )->QColor :
-        mapping ={
-        "scheduled":QColor ("#2f5cb1"),
-        "pending":QColor ("#6f50b5"),
-        "running":QColor ("#996f00"),
-        "completed":QColor ("#1f7c4a"),
-        "failed":QColor ("#bb334a"),
-        "cancelled":QColor ("#566084"),
-        }
-        return mapping .get (status ,QColor ("#4d5a84"))
+        return self ._STATUS_COLORS .get (status ,self ._DEFAULT_STATUS_COLOR )
 
     def _apply_responsive_mode (self )->None :
         width =self .width ()
         compact_sidebar =width <1240 
         narrow =width <980 
+        if narrow :
+            min_column_width =240 
+        elif width <1350 :
+            min_column_width =290 
+        else :
+            min_column_width =330 
+
+        state =(compact_sidebar ,narrow ,min_column_width )
+        previous =self ._last_responsive_state 
+        if state ==previous :
+            return 
+        self ._last_responsive_state =state 
+
+        if previous is None or previous [0 ]!=compact_sidebar :
+            self ._apply_sidebar_mode (compact_sidebar )
+
+        if previous is None or previous [1 ]!=narrow :
+            direction =QBoxLayout .Direction .TopToBottom if narrow else QBoxLayout .Direction .LeftToRight 
+            self .header_layout .setDirection (direction )
+            self .metrics_layout .setDirection (direction )
+
+        if previous is None or previous [2 ]!=min_column_width :
+            self .projects_grid .set_min_column_width (min_column_width )
 
+    def _apply_sidebar_mode (self ,compact_sidebar :bool )->None :
         if compact_sidebar :
             self .sidebar .setFixedWidth (82 )
             self .brand_label .hide ()
@@ -698,19 +930,7 @@ class DashboardView (QWidget ):
                 button .setText (str (button .property ("fullText")))
                 button .setToolTip ("")
 
-        if narrow :
-            self .header_layout .setDirection (QBoxLayout .Direction .TopToBottom )
-            self .metrics_layout .setDirection (QBoxLayout .Direction .TopToBottom )
-            self .projects_grid .set_min_column_width (240 )
-        else :
-            self .header_layout .setDirection (QBoxLayout .Direction .LeftToRight )
-            self .metrics_layout .setDirection (QBoxLayout .Direction .LeftToRight )
-            if width <1350 :
-                self .projects_grid .set_min_column_width (290 )
-            else :
-                self .projects_grid .set_min_column_width (330 )
-
     def resizeEvent (self ,event )->None :# type: ignore[override]
         super ().resizeEvent (event )
-        self ._apply_responsive_mode ()
+        self ._resize_timer .start ()
 
@@ -3,17 +3,29 @@
 from __future__ import annotations 
 
 import json 
-from datetime import datetime 
+import mmap 
+import threading 
+from collections .abc import Callable 
+from concurrent .futures import Future ,ThreadPoolExecutor 
+from dataclasses import dataclass 
+from functools import partial 
+from operator import itemgetter 
 from pathlib import Path 
+from time import monotonic ,strftime 
 from typing import Any 
 
-from PyQt6 .QtCore import QThreadPool ,QTimer 
+try :
+    import orjson 
+except ImportError :# optional: faster parsing of large result files
+    orjson =None 
+
+from PyQt6 .QtCore import QThread ,QThreadPool ,QTimer 
 from PyQt6 .QtWidgets import QMainWindow ,QStackedWidget 
 
 from gme_app .api .client import ApiError ,GMEManagementClient 
 from gme_app .config import AppConfig 
-from gme_app .models import Artifact ,AudioProvider ,ProcessingRun ,Project ,UserProfile 
-from gme_app .services .session_store import SessionStore 
+from gme_app .models import Artifact ,AudioProvider ,ProcessingRun ,Project ,ProjectBundle ,UserProfile 
+from gme_app .services .session_store import PersistedSession ,SessionStore 
 from gme_app .ui .admin_view import AdminView 
 from gme_app .ui .auth_view import AuthView 
 from gme_app .ui .dashboard_view import DashboardView 
@@ -21,14 +33,41 @@ from gme_app .ui .profile_view import ProfileView
 from gme_app .ui .project_view import ProjectView ,safe_float 
 from gme_app .workers import Worker 
 
-LIE_RISK_KEYS :tuple [str ,...]=(
+LIE_RISK_KEYS :frozenset [str ]=frozenset ({
 "risk",
 "deception_score",
 "deception",
 "lie_probability",
 "lie_score",
 "lie",
+})
+LATEST_RUN_FETCH_WORKERS =8 
+METADATA_CACHE_TTL_SECONDS =60.0 
+WORKER_FREELIST_SIZE =16 
+PROJECT_FETCH_WORKERS =4 
+TIMELINE_CACHE_SIZE =16 
+# Where result payloads keep their frame list, checked on the payload itself and then under "result".
+FRAME_PAYLOAD_KEYS :tuple [str ,...]=("frames","results")
+AUDIO_RESULT_PATH_HINTS :tuple [str ,...]=(
+"audio_result_remote",
+"audio_result",
+"audio_solution",
+"audio_report",
+"audio/",
+"/audio_",
 )
+# Background tasks mostly wait on HTTP, so the pool is sized past the core count.
+BACKGROUND_THREADS_PER_CORE =4 
+MIN_BACKGROUND_THREADS =8 
+
+
+@dataclass (frozen =True ,slots =True )
+class DashboardSnapshot :
+    models :list [str ]
+    detectors :list [str ]
+    audio_providers :list [AudioProvider ]
+    projects :list [Project ]
+    runs :list [tuple [Project ,ProcessingRun |None ]]
 
 
 class MainWindow (QMainWindow ):
@@ -45,7 +84,11 @@ class MainWindow (QMainWindow ):
         )
         self .session_store =SessionStore (config .app_data_dir /"session.json")
         self .thread_pool =QThreadPool .globalInstance ()
+        self .thread_pool .setMaxThreadCount (
+        max (MIN_BACKGROUND_THREADS ,BACKGROUND_THREADS_PER_CORE *QThread .idealThreadCount ())
+        )
         self ._active_workers :set [Worker ]=set ()
+        self ._worker_freelist :list [Worker ]=[]
         self .current_user :UserProfile |None =None 
         self .current_project_id :str |None =None 
         self .current_project_run_id :str |None =None 
@@ -57,9 +100,48 @@ class MainWindow (QMainWindow ):
         self ._admin_users_role :str |None =None 
         self ._admin_users_active :bool |None =None 
         self ._admin_projects_query :str =""
+        self._broadcast_user_state: UserProfile | None = None
+        self._applied_models: tuple[str, ...] | None = None
+        self._applied_detectors: tuple[str, ...] | None = None
+        self._applied_audio_providers: tuple[AudioProvider, ...] | None = None
         self._is_refreshing_dashboard = False
         self._is_refreshing_admin = False
+        # One token per in-flight refresh that turned the spinner on; it goes off when the last one finishes,
+        # even if that request was superseded by a newer one that did not show status.
+        self._dashboard_loading_tokens: set[object] = set()
+        self._admin_loading_tokens: set[object] = set()
         self._is_refreshing_project = False
+        self._is_prefetching_dashboard = False
+        self._prefetched_dashboard: DashboardSnapshot | None = None
+        self._prefetched_dashboard_at = 0.0
+        self._latest_runs_batch_supported = True
+        self._project_bundle_supported = True
+        self._runs_sync_batch_supported = True
+        self._metadata_cache: dict[str, tuple[float, Any]] = {}
+        self._timeline_cache: dict[tuple[str, int, int, str], Any] = {}
+        # The video and audio timeline futures of one refresh read and evict concurrently.
+        self._timeline_cache_lock = threading.Lock()
+        self._run_view_cache: dict[tuple[str, str], dict[str, Any]] = {}
+        self._inflight_downloads: dict[Path, Future[None]] = {}
+        self._downloads_lock = threading.Lock()
+        self._pending_session_save: dict[str, Any] | None = None
+        self._session_save_timer = QTimer(self)
+        self._session_save_timer.setSingleShot(True)
+        self._session_save_timer.setInterval(500)
+        self._session_save_timer.timeout.connect(self._flush_session_save)
+        # Bumped whenever in-flight results must be discarded (newer request or session reset).
+        self._dashboard_refresh_generation = 0
+        self._admin_refresh_generation = 0
+        self._admin_filter_timer = QTimer(self)
+        self._admin_filter_timer.setSingleShot(True)
+        self._admin_filter_timer.setInterval(250)
+        self._admin_filter_timer.timeout.connect(self._apply_admin_filters)
+        # Only the latest (project_id, run_id, show_status) survives a burst of refresh requests.
+        self._pending_project_refresh: tuple[str, str, bool] | None = None
+        self._project_refresh_timer = QTimer(self)
+        self._project_refresh_timer.setSingleShot(True)
+        self._project_refresh_timer.setInterval(150)
+        self._project_refresh_timer.timeout.connect(self._flush_project_refresh)
         self._auto_refresh_timer = QTimer(self)
         self._auto_refresh_timer.setInterval(10_000)
         self._auto_refresh_timer.timeout.connect(self._on_auto_refresh_tick)
@@ -85,6 +167,13 @@ class MainWindow (QMainWindow ):
         self .stack .addWidget (self .project_view )
         self .setCentralWidget (self .stack )
         self .stack .setCurrentWidget (self .auth_view )
+        self ._session_views =(self .dashboard_view ,self .profile_view ,self .admin_view ,self .project_view )
+        # Bound once and reused as on_finished for every background task.
+        self ._clear_auth_busy =partial (self .auth_view .set_busy ,False )
+        self ._stop_dashboard_loading =partial (self .dashboard_view .set_loading ,False )
+        self ._stop_profile_loading =partial (self .profile_view .set_loading ,False )
+        self ._stop_admin_loading =partial (self .admin_view .set_loading ,False )
+        self ._stop_project_loading =partial (self .project_view .set_loading ,False )
 
     def _connect_signals (self )->None :
         self .auth_view .login_submitted .connect (self ._on_login_submitted )
@@ -130,42 +219,78 @@ class MainWindow (QMainWindow ):
     on_error =None ,
     on_finished =None ,
     )->None :
-        worker =Worker (fn )
+        if self ._worker_freelist :
+            worker =self ._worker_freelist .pop ()
+            worker .reset (fn )
+        else :
+            worker =Worker (fn )
+            # Finished workers go back to the free list instead of being deleted by the pool.
+            worker .setAutoDelete (False )
+        # Keeps the Python wrapper (and its signals object) alive until the queued finished signal lands;
+        # a plain counter would let the wrapper be collected while the pool still runs it.
         self ._active_workers .add (worker )
         if on_result is not None :
             worker .signals .result .connect (on_result )
         if on_error is not None :
             worker .signals .error .connect (on_error )
-
-        def _finalize ()->None :
-            self ._active_workers .discard (worker )
-            if on_finished is not None :
-                on_finished ()
-
-        worker .signals .finished .connect (_finalize )
+        worker .signals .finished .connect (partial (self ._finalize_worker ,worker ,on_finished ))
         self .thread_pool .start (worker )
 
+    def _finalize_worker (self ,worker :Worker ,on_finished )->None :
+        self ._active_workers .discard (worker )
+        if on_finished is not None :
+            on_finished ()
+        if len (self ._worker_freelist )<WORKER_FREELIST_SIZE :
+            self ._worker_freelist .append (worker )
+
     def _restore_session (self )->None :
         persisted =self .session_store .load ()
         if not persisted :
             return 
         if persisted .api_base_url !=self .config .api_base_url :
-            self .session_store .clear ()
+            self ._clear_persisted_session ()
             return 
 
         self .auth_view .prefill_login (persisted .user_login )
-        self .auth_view .set_busy (True ,"Восстанавливаем сессию...")
         self .client .set_session_token (persisted .session_token )
+        cached_user =self ._persisted_user (persisted )
+        if cached_user is not None :
+            # Show the dashboard for the remembered profile right away; the token is checked in the background.
+            self ._enter_dashboard (user =cached_user ,remember =True ,login_hint =persisted .user_login )
+            self ._run_background (
+            self .client .get_me ,
+            on_result =self ._on_restored_user_validated ,
+            on_error =self ._on_restored_user_rejected ,
+            )
+            return 
 
-        def task ()->UserProfile :
-            return self .client .get_me ()
+        self .auth_view .set_busy (True ,"Восстанавливаем сессию...")
 
-        def on_success (user :UserProfile )->None :
+        def load_snapshot ()->DashboardSnapshot |None :
+            try :
+                return self ._load_dashboard_snapshot ()
+            except ApiError :
+                return None 
+
+        def task ()->tuple [UserProfile ,DashboardSnapshot |None ]:
+            # The dashboard data is requested alongside the profile so it is ready once the session checks out.
+            with ThreadPoolExecutor (max_workers =2 )as executor :
+                snapshot_future =executor .submit (load_snapshot )
+                user =self .client .get_me ()
+                return user ,snapshot_future .result ()
+
+        def on_success (result :tuple [UserProfile ,DashboardSnapshot |None ])->None :
+            user ,snapshot =result 
             self .auth_view .set_busy (False )
-            self ._enter_dashboard (user =user ,remember =True ,login_hint =persisted .user_login )
+            self ._enter_dashboard (
+            user =user ,
+            remember =True ,
+            login_hint =persisted .user_login ,
+            snapshot =snapshot ,
+            )
 
         def on_error (error :Exception )->None :
-            self .session_store .clear ()
+            self ._clear_persisted_session ()
             self .client .clear_session_token ()
             self .auth_view .set_busy (False )
             self .auth_view .show_info ("Сохраненная сессия истекла. Войдите снова.")
@@ -173,11 +298,97 @@ class MainWindow (QMainWindow ):
 
         self ._run_background (task ,on_result =on_success ,on_error =on_error )
 
+    @staticmethod
+    def _persisted_user(persisted: PersistedSession) -> UserProfile | None:
+        if persisted.user_profile is None:
+            return None
+        try:
+            return UserProfile.from_api(persisted.user_profile)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _on_restored_user_validated(self, user: UserProfile) -> None:
+        if self.current_user is None or self.current_user.id != user.id:
+            return
+        if user == self.current_user:
+            return
+        self.current_user = user
+        self._broadcast_user(user)
+        session_token = self.client.get_session_token()
+        if session_token:
+            self._schedule_session_save(
+                api_base_url=self.config.api_base_url,
+                session_token=session_token,
+                user_login=user.login,
+                user_profile=user.to_api(),
+            )
+
+    def _broadcast_user(self, user: UserProfile) -> None:
+        # Re-entering with the same profile (restore, re-login) must not rebuild the views.
+        if user == self._broadcast_user_state:
+            return
+        self._broadcast_user_state = user
+        self.dashboard_view.set_user(user)
+        self.profile_view.set_user(user)
+        self.profile_view.set_admin_mode(user.role == "admin")
+        self.project_view.set_user(user)
+
+    def _on_restored_user_rejected(self, error: Exception) -> None:
+        # Only an explicit rejection ends the session; network trouble leaves the remembered profile in place.
+        if isinstance(error, ApiError) and error.status_code == 401 and self.current_user is not None:
+            self._handle_session_expired()
+
+    def _schedule_session_save(
+        self,
+        *,
+        api_base_url: str,
+        session_token: str,
+        user_login: str,
+        user_profile: dict[str, Any] | None = None,
+    ) -> None:
+        # Bursts of saves collapse into one write, which happens off the GUI thread.
+        self._pending_session_save = {
+            "api_base_url": api_base_url,
+            "session_token": session_token,
+            "user_login": user_login,
+            "user_profile": user_profile,
+        }
+        self._session_save_timer.start()
+
+    def _flush_session_save(self) -> None:
+        payload = self._pending_session_save
+        self._pending_session_save = None
+        if payload is not None:
+            # Tagged with the store's generation so a logout that lands first makes this save a no-op.
+            self._run_background(
+                partial(self.session_store.save, **payload, generation=self.session_store.generation)
+            )
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        # A save still waiting on the debounce timer would be lost on exit, so write it now.
+        self._session_save_timer.stop()
+        payload = self._pending_session_save
+        self._pending_session_save = None
+        if payload is not None:
+            self.session_store.save(**payload)
+        super().closeEvent(event)
+
+    def _clear_persisted_session(self) -> None:
+        self._session_save_timer.stop()
+        self._pending_session_save = None
+        self.session_store.clear()
+
     def _show_auth (self )->None :
         self._stop_auto_refresh()
         self .stack .setCurrentWidget (self .auth_view )
 
     def _show_dashboard (self )->None :
+        snapshot = self._prefetched_dashboard
+        self._prefetched_dashboard = None
+        # A snapshot older than one auto-refresh period is dropped rather than shown.
+        max_age = self._auto_refresh_timer.interval() / 1000
+        if snapshot is not None and monotonic() - self._prefetched_dashboard_at <= max_age:
+            self._apply_dashboard_snapshot(snapshot)
         self .dashboard_view .set_active_nav ("projects")
         self .stack .setCurrentWidget (self .dashboard_view )
 
@@ -197,6 +408,7 @@ class MainWindow (QMainWindow ):
         if self .current_user .role !="admin":
             self .dashboard_view .set_status_message ("Требуются права администратора.",is_error =True )
             self ._show_dashboard ()
+            self .refresh_dashboard ()
             return 
         self .dashboard_view .set_active_nav ("admin")
         self .stack .setCurrentWidget (self .admin_view )
@@ -220,6 +432,8 @@ class MainWindow (QMainWindow ):
             return
 
         current_widget = self.stack.currentWidget()
+        if current_widget is not self.dashboard_view:
+            self._prefetch_dashboard()
         if current_widget is self.project_view:
             has_active_run = any(
                 run.status in {"scheduled", "pending", "running"}
@@ -263,7 +477,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .auth_view .set_busy (False ),
+        on_finished =self ._clear_auth_busy ,
         )
 
     def _on_register_submitted (self ,login :str ,email :str ,password :str )->None :
@@ -285,29 +499,37 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .auth_view .set_busy (False ),
+        on_finished =self ._clear_auth_busy ,
         )
 
-    def _enter_dashboard (self ,*,user :UserProfile ,remember :bool ,login_hint :str )->None :
+    def _enter_dashboard (
+    self ,
+    *,
+    user :UserProfile ,
+    remember :bool ,
+    login_hint :str ,
+    snapshot :DashboardSnapshot |None =None ,
+    )->None :
         self .current_user =user 
-        self .dashboard_view .set_user (user )
-        self .dashboard_view .set_admin_mode (user .role =="admin")
-        self .profile_view .set_user (user )
-        self .profile_view .set_admin_mode (user .role =="admin")
-        self .project_view .set_user (user )
+        self ._broadcast_user (user )
         session_token =self .client .get_session_token ()
         if remember and session_token :
-            self .session_store .save (
+            self ._schedule_session_save (
             api_base_url =self .config .api_base_url ,
             session_token =session_token ,
             user_login =login_hint ,
+            user_profile =user .to_api (),
             )
         else :
-            self .session_store .clear ()
+            self ._clear_persisted_session ()
 
         self._start_auto_refresh()
-        self ._show_dashboard ()
-        self .refresh_dashboard ()
+        if snapshot is not None:
+            self._prefetched_dashboard = snapshot
+            self._prefetched_dashboard_at = monotonic()
+        self._show_dashboard()
+        if snapshot is None:
+            self.refresh_dashboard()
 
     def _load_audio_providers_on_demand (self ,*,show_error_on_project :bool =False )->None :
         if self ._is_loading_audio_providers :
@@ -330,6 +552,7 @@ class MainWindow (QMainWindow ):
             self ._available_audio_providers ,
             loaded_from_server =True ,
             )
+            self ._applied_audio_providers =tuple (self ._available_audio_providers )
 
         def on_error (error :Exception )->None :
             self .project_view .mark_audio_providers_request_failed ()
@@ -361,118 +584,246 @@ class MainWindow (QMainWindow ):
         if self._is_refreshing_dashboard and not force:
             return
         self._is_refreshing_dashboard = True
-
-        if show_status:
+        self._dashboard_refresh_generation += 1
+        generation = self._dashboard_refresh_generation
+        # Anything prefetched so far predates this request (and possibly the mutation that triggered it).
+        self._prefetched_dashboard = None
+
+        loading_token = object() if show_status else None
+        if loading_token is not None:
+            self._dashboard_loading_tokens.add(loading_token)
             self.dashboard_view.set_loading(True, "Обновляем данные панели...")
 
-        def task() -> dict[str, Any]:
-            models: list[str] = []
-            detectors: list[str] = []
-            audio_providers: list[AudioProvider] = []
-            try:
-                models = self.client.get_processing_models()
-            except ApiError:
-                models = []
-            try:
-                detectors = self.client.get_face_detectors()
-            except ApiError:
-                detectors = []
-            try:
-                audio_providers = self.client.get_audio_providers()
-            except ApiError:
-                audio_providers = []
+        def on_success(result: DashboardSnapshot) -> None:
+            if generation != self._dashboard_refresh_generation:
+                return
+            self._prefetched_dashboard = None
+            self._apply_dashboard_snapshot(result)
+            if show_status:
+                self.dashboard_view.set_status_message(
+                    f"Данные обновлены: {strftime('%H:%M:%S')}",
+                    is_error=False,
+                )
+        def on_error(error: Exception) -> None:
+            if generation != self._dashboard_refresh_generation:
+                return
+            if isinstance(error, ApiError) and error.status_code == 401:
+                self._handle_session_expired()
+                return
+            self.dashboard_view.set_status_message(self._format_error(error), is_error=True)
+
+        def on_finished() -> None:
+            if loading_token in self._dashboard_loading_tokens:
+                self._dashboard_loading_tokens.discard(loading_token)
+                if not self._dashboard_loading_tokens:
+                    self.dashboard_view.set_loading(False)
+            if generation != self._dashboard_refresh_generation:
+                return
+            self._is_refreshing_dashboard = False
+
+        self._run_background(
+            self._load_dashboard_snapshot,
+            on_result=on_success,
+            on_error=on_error,
+            on_finished=on_finished,
+        )
+
+    def _load_dashboard_snapshot(self) -> DashboardSnapshot:
+        # The metadata lookups are independent of the project list, so they run while projects and runs load.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            models_future = executor.submit(self._cached_metadata, "models", self.client.get_processing_models)
+            detectors_future = executor.submit(self._cached_metadata, "detectors", self.client.get_face_detectors)
+            audio_providers_future = executor.submit(
+                self._cached_metadata,
+                "audio_providers",
+                self.client.get_audio_providers,
+            )
 
             projects_page = self.client.list_projects(limit=100, offset=0)
             projects = projects_page.items
-            runs: list[tuple[Project, ProcessingRun | None]] = []
-
             fetch_runs_limit = min(30, len(projects))
-            for index, project in enumerate(projects):
-                latest_run: ProcessingRun | None = None
-                if index < fetch_runs_limit:
-                    try:
-                        run_page = self.client.list_processing_runs(
-                            project_id=str(project.id),
-                            limit=1,
-                            offset=0,
-                        )
-                    except ApiError:
-                        latest_run = None
-                    else:
-                        latest_run = run_page.items[0] if run_page.items else None
-                        if latest_run is not None and latest_run.status in {"scheduled", "pending", "running"}:
-                            try:
-                                self.client.sync_processing_run(
-                                    project_id=str(project.id),
-                                    run_id=str(latest_run.id),
-                                )
-                                run_page = self.client.list_processing_runs(
-                                    project_id=str(project.id),
-                                    limit=1,
-                                    offset=0,
-                                )
-                                latest_run = run_page.items[0] if run_page.items else latest_run
-                            except ApiError:
-                                pass
-                runs.append((project, latest_run))
+            latest_runs = self._fetch_latest_runs(projects[:fetch_runs_limit])
 
-            return {
-                "models": models,
-                "detectors": detectors,
-                "audio_providers": audio_providers,
-                "projects": projects,
-                "runs": runs,
-            }
+            models: list[str] = self._result_or_default(models_future, [])
+            detectors: list[str] = self._result_or_default(detectors_future, [])
+            audio_providers: list[AudioProvider] = self._result_or_default(audio_providers_future, [])
 
-        def on_success(result: dict[str, Any]) -> None:
-            fetched_models = [str(item) for item in result.get("models", []) if str(item).strip()]
-            if fetched_models:
-                self._available_models = fetched_models
-            fetched_detectors = [str(item) for item in result.get("detectors", []) if str(item).strip()]
-            if fetched_detectors:
-                self._available_detectors = fetched_detectors
-            fetched_audio_providers = [
-                item
-                for item in result.get("audio_providers", [])
-                if isinstance(item, AudioProvider) and item.code
-            ]
-            if fetched_audio_providers:
-                self._available_audio_providers = fetched_audio_providers
+        runs: list[tuple[Project, ProcessingRun | None]] = [
+            (project, latest_runs[index] if index < fetch_runs_limit else None)
+            for index, project in enumerate(projects)
+        ]
+
+        return DashboardSnapshot(
+            models=models,
+            detectors=detectors,
+            audio_providers=audio_providers,
+            projects=projects,
+            runs=runs,
+        )
+
+    def _cached_metadata(self, key: str, loader: Callable[[], Any]) -> Any:
+        cached = self._metadata_cache.get(key)
+        if cached is not None and monotonic() - cached[0] < METADATA_CACHE_TTL_SECONDS:
+            return cached[1]
+        value = loader()
+        # Empty answers are not kept so a service that was briefly unavailable is asked again next time.
+        if value:
+            self._metadata_cache[key] = (monotonic(), value)
+        return value
+
+    @staticmethod
+    def _result_or_default(future: Future[Any], default: Any) -> Any:
+        try:
+            return future.result()
+        except ApiError:
+            return default
+
+    def _apply_dashboard_snapshot(self, result: DashboardSnapshot) -> None:
+        fetched_models = [str(item) for item in result.models if str(item).strip()]
+        if fetched_models:
+            self._available_models = fetched_models
+        fetched_detectors = [str(item) for item in result.detectors if str(item).strip()]
+        if fetched_detectors:
+            self._available_detectors = fetched_detectors
+        fetched_audio_providers = [
+            item
+            for item in result.audio_providers
+            if isinstance(item, AudioProvider) and item.code
+        ]
+        if fetched_audio_providers:
+            self._available_audio_providers = fetched_audio_providers
 
+        # The project view rebuilds its combo boxes on every set_*, so unchanged lists are not re-applied.
+        models = tuple(self._available_models)
+        if models != self._applied_models:
+            self._applied_models = models
             self.dashboard_view.set_models(self._available_models)
-            self.dashboard_view.set_detectors(self._available_detectors)
-            self.dashboard_view.set_audio_providers(self._available_audio_providers)
             self.project_view.set_models(self._available_models)
+        detectors = tuple(self._available_detectors)
+        if detectors != self._applied_detectors:
+            self._applied_detectors = detectors
+            self.dashboard_view.set_detectors(self._available_detectors)
             self.project_view.set_detectors(self._available_detectors)
+        audio_providers = tuple(self._available_audio_providers)
+        if audio_providers != self._applied_audio_providers:
+            self._applied_audio_providers = audio_providers
+            self.dashboard_view.set_audio_providers(self._available_audio_providers)
             self.project_view.set_audio_providers(self._available_audio_providers)
-            self.dashboard_view.set_dashboard_data(
-                projects=list(result["projects"]),
-                runs=list(result["runs"]),
-            )
+        self.dashboard_view.set_dashboard_data(
+            projects=result.projects,
+            runs=result.runs,
+        )
 
-            if show_status:
-                self.dashboard_view.set_status_message(
-                    f"Данные обновлены: {datetime.now().strftime('%H:%M:%S')}",
-                    is_error=False,
-                )
-        def on_error(error: Exception) -> None:
-            if isinstance(error, ApiError) and error.status_code == 401:
-                self._handle_session_expired()
-                return
-            self.dashboard_view.set_status_message(self._format_error(error), is_error=True)
+    def _prefetch_dashboard(self) -> None:
+        if self.current_user is None or self._is_refreshing_dashboard:
+            return
+        if self._is_prefetching_dashboard:
+            return
+        self._is_prefetching_dashboard = True
+        user = self.current_user
+        generation = self._dashboard_refresh_generation
+
+        def on_success(result: DashboardSnapshot) -> None:
+            # A refresh started after this prefetch has newer data; the snapshot would only roll it back.
+            if self.current_user is user and generation == self._dashboard_refresh_generation:
+                # Each tick replaces the snapshot, so the dashboard never opens on data older than one period.
+                self._prefetched_dashboard = result
+                self._prefetched_dashboard_at = monotonic()
 
         def on_finished() -> None:
-            self._is_refreshing_dashboard = False
-            if show_status:
-                self.dashboard_view.set_loading(False)
+            self._is_prefetching_dashboard = False
 
+        # Errors are left to the regular refresh that follows when the dashboard is opened.
         self._run_background(
-            task,
+            self._load_dashboard_snapshot,
             on_result=on_success,
-            on_error=on_error,
             on_finished=on_finished,
         )
 
+    def _fetch_latest_runs(self, projects: list[Project]) -> list[ProcessingRun | None]:
+        if not projects:
+            return []
+        if self._latest_runs_batch_supported:
+            try:
+                latest_by_project = self.client.list_latest_processing_runs(
+                    project_ids=[str(project.id) for project in projects],
+                )
+            except ApiError as exc:
+                if exc.status_code in {404, 405}:
+                    self._latest_runs_batch_supported = False
+            else:
+                latest_runs = [latest_by_project.get(project.id) for project in projects]
+                active = [
+                    index
+                    for index, run in enumerate(latest_runs)
+                    if run is not None and run.status in {"scheduled", "pending", "running"}
+                ]
+                if active:
+                    self._sync_active_runs(projects, latest_runs, active)
+                return latest_runs
+
+        # Servers without the batch endpoint get one lookup per project, overlapped instead of in sequence.
+        with ThreadPoolExecutor(max_workers=min(LATEST_RUN_FETCH_WORKERS, len(projects))) as executor:
+            return list(executor.map(self._fetch_latest_run, projects))
+
+    def _sync_active_runs(
+        self,
+        projects: list[Project],
+        latest_runs: list[ProcessingRun | None],
+        active: list[int],
+    ) -> None:
+        if self._runs_sync_batch_supported:
+            try:
+                synced_by_id = self.client.sync_processing_runs(
+                    run_ids=[str(latest_runs[index].id) for index in active],
+                )
+            except ApiError as exc:
+                if exc.status_code in {404, 405}:
+                    self._runs_sync_batch_supported = False
+                else:
+                    return
+            else:
+                for index in active:
+                    latest_runs[index] = synced_by_id.get(latest_runs[index].id, latest_runs[index])
+                return
+
+        with ThreadPoolExecutor(max_workers=min(LATEST_RUN_FETCH_WORKERS, len(active))) as executor:
+            synced = executor.map(lambda index: self._sync_active_run(projects[index], latest_runs[index]), active)
+            for index, run in zip(active, synced):
+                latest_runs[index] = run
+
+    def _fetch_latest_run(self, project: Project) -> ProcessingRun | None:
+        try:
+            run_page = self.client.list_processing_runs(
+                project_id=str(project.id),
+                limit=1,
+                offset=0,
+            )
+        except ApiError:
+            return None
+        latest_run = run_page.items[0] if run_page.items else None
+        return self._sync_active_run(project, latest_run)
+
+    def _sync_active_run(self, project: Project, latest_run: ProcessingRun | None) -> ProcessingRun | None:
+        if latest_run is None or latest_run.status not in {"scheduled", "pending", "running"}:
+            return latest_run
+        try:
+            synced_run = self.client.sync_and_get_processing_run(
+                project_id=str(project.id),
+                run_id=str(latest_run.id),
+            )
+            if synced_run is not None:
+                return synced_run
+            run_page = self.client.list_processing_runs(
+                project_id=str(project.id),
+                limit=1,
+                offset=0,
+            )
+            latest_run = run_page.items[0] if run_page.items else latest_run
+        except ApiError:
+            pass
+        return latest_run
+
     def refresh_admin_panel(self, *, show_status: bool = True, force: bool = False) -> None:
         if self.current_user is None:
             return
@@ -482,8 +833,11 @@ class MainWindow (QMainWindow ):
         if self._is_refreshing_admin and not force:
             return
         self._is_refreshing_admin = True
+        generation = self._admin_refresh_generation
 
-        if show_status:
+        loading_token = object() if show_status else None
+        if loading_token is not None:
+            self._admin_loading_tokens.add(loading_token)
             self.admin_view.set_loading(True, "Загружаем данные админ-панели...")
 
         def task() -> dict[str, Any]:
@@ -505,24 +859,32 @@ class MainWindow (QMainWindow ):
             }
 
         def on_success(result: dict[str, Any]) -> None:
+            if generation != self._admin_refresh_generation:
+                return
             self.admin_view.set_users(list(result.get("users", [])))
             self.admin_view.set_projects(list(result.get("projects", [])))
             if show_status:
                 self.admin_view.set_status_message(
-                    f"Данные админ-панели обновлены: {datetime.now().strftime('%H:%M:%S')}",
+                    f"Данные админ-панели обновлены: {strftime('%H:%M:%S')}",
                     is_error=False,
                 )
 
         def on_error(error: Exception) -> None:
+            if generation != self._admin_refresh_generation:
+                return
             if isinstance(error, ApiError) and error.status_code == 401:
                 self._handle_session_expired()
                 return
             self.admin_view.set_status_message(self._format_error(error), is_error=True)
 
         def on_finished() -> None:
+            if loading_token in self._admin_loading_tokens:
+                self._admin_loading_tokens.discard(loading_token)
+                if not self._admin_loading_tokens:
+                    self.admin_view.set_loading(False)
+            if generation != self._admin_refresh_generation:
+                return
             self._is_refreshing_admin = False
-            if show_status:
-                self.admin_view.set_loading(False)
 
         self._run_background(
             task,
@@ -542,9 +904,7 @@ class MainWindow (QMainWindow ):
 
         def on_success (user :UserProfile )->None :
             self .current_user =user 
-            self .dashboard_view .set_user (user )
-            self .profile_view .set_user (user )
-            self .project_view .set_user (user )
+            self ._broadcast_user (user )
             self .profile_view .set_status_message ("Профиль обновлен.",is_error =False )
 
         def on_error (error :Exception )->None :
@@ -557,7 +917,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .profile_view .set_loading (False ),
+        on_finished =self ._stop_profile_loading ,
         )
 
     def _on_change_password_requested (self ,old_password :str ,new_password :str ,revoke_other :bool )->None :
@@ -584,18 +944,26 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .profile_view .set_loading (False ),
+        on_finished =self ._stop_profile_loading ,
         )
 
     def _on_admin_users_filter_requested (self ,query :str ,role :object ,active :object )->None :
         self ._admin_users_query =query .strip ()
         self ._admin_users_role =str (role ).strip ()if isinstance (role ,str )and str (role ).strip ()else None 
         self ._admin_users_active =active if isinstance (active ,bool )else None 
-        self .refresh_admin_panel ()
+        self._schedule_admin_filter_refresh()
 
     def _on_admin_projects_filter_requested (self ,query :str )->None :
         self ._admin_projects_query =query .strip ()
-        self .refresh_admin_panel ()
+        self._schedule_admin_filter_refresh()
+
+    def _schedule_admin_filter_refresh(self) -> None:
+        self._admin_refresh_generation += 1
+        self._admin_filter_timer.start()
+
+    def _apply_admin_filters(self) -> None:
+        # A newer filter supersedes whatever request is still in flight.
+        self.refresh_admin_panel(force=True)
 
     def _on_admin_change_user_role_requested (self ,user_id :str ,role :str )->None :
         self .admin_view .set_loading (True ,"Обновляем роль пользователя...")
@@ -617,7 +985,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .admin_view .set_loading (False ),
+        on_finished =self ._stop_admin_loading ,
         )
 
     def _on_admin_change_user_active_requested (self ,user_id :str ,is_active :bool )->None :
@@ -641,7 +1009,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .admin_view .set_loading (False ),
+        on_finished =self ._stop_admin_loading ,
         )
 
     def _on_admin_delete_project_requested (self ,project_id :str )->None :
@@ -665,7 +1033,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .admin_view .set_loading (False ),
+        on_finished =self ._stop_admin_loading ,
         )
 
     def _on_create_project (
@@ -708,7 +1076,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .dashboard_view .set_loading (False ),
+        on_finished =self ._stop_dashboard_loading ,
         )
 
     def _on_start_processing (
@@ -746,7 +1114,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _on_cancel_processing (self ,project_id :str ,run_id :str )->None :
@@ -771,7 +1139,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _on_delete_project (self ,project_id :str )->None :
@@ -783,6 +1151,8 @@ class MainWindow (QMainWindow ):
         def on_success (_ :Any )->None :
             self .current_project_id =None 
             self .current_project_run_id =None 
+            # Any prefetched snapshot still lists the deleted project.
+            self ._prefetched_dashboard =None 
             self ._show_dashboard ()
             self .dashboard_view .set_status_message ("Проект удален.",is_error =False )
             self .refresh_dashboard ()
@@ -797,14 +1167,12 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _on_logout (self )->None :
-        self .dashboard_view .set_loading (True ,"Выходим из системы...")
-        self .profile_view .set_loading (True ,"Выходим из системы...")
-        self .admin_view .set_loading (True ,"Выходим из системы...")
-        self .project_view .set_loading (True ,"Выходим из системы...")
+        for view in self ._session_views :
+            view .set_loading (True ,"Выходим из системы...")
 
         def task ()->None :
             try :
@@ -819,24 +1187,22 @@ class MainWindow (QMainWindow ):
             self ._show_auth ()
 
         def on_error (error :Exception )->None :
-            message =self ._format_error (error )
-            self .dashboard_view .set_status_message (message ,is_error =True )
-            self .profile_view .set_status_message (message ,is_error =True )
-            self .admin_view .set_status_message (message ,is_error =True )
-            self .project_view .set_status_message (message ,is_error =True )
+            # Only the view the user is on shows the error; the others would keep a stale message.
+            current_view =self .stack .currentWidget ()
+            if current_view in self ._session_views :
+                current_view .set_status_message (self ._format_error (error ),is_error =True )
 
         self ._run_background (
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :(
-        self .dashboard_view .set_loading (False ),
-        self .profile_view .set_loading (False ),
-        self .admin_view .set_loading (False ),
-        self .project_view .set_loading (False ),
-        ),
+        on_finished =self ._stop_all_loading ,
         )
 
+    def _stop_all_loading (self )->None :
+        for view in self ._session_views :
+            view .set_loading (False )
+
     def _on_open_project_requested (self ,project_id :str )->None :
         self .current_project_id =project_id 
         self .current_project_run_id =None 
@@ -853,10 +1219,56 @@ class MainWindow (QMainWindow ):
         self .refresh_dashboard ()
 
     def _on_project_refresh_requested (self ,project_id :str ,run_id :str )->None :
-        self ._refresh_project (project_id =project_id ,preferred_run_id =run_id )
+        self ._schedule_project_refresh (project_id ,run_id ,show_status =True )
 
     def _on_project_run_selected (self ,project_id :str ,run_id :str )->None :
-        self ._refresh_project (project_id =project_id ,preferred_run_id =run_id ,show_status =False )
+        cached_view =self ._run_view_cache .get ((project_id ,run_id ))
+        current_project =self .project_view .current_project 
+        if cached_view is not None and current_project is not None and str (current_project .id )==project_id :
+            # A finished run's artifacts never change, so switching back to it needs no requests at all.
+            self ._cancel_project_refresh ()
+            self .current_project_run_id =run_id 
+            self .project_view .set_project_data (
+            project =current_project ,
+            members =self .project_view .current_members ,
+            runs =self .project_view .current_runs ,
+            selected_run_id =run_id ,
+            **cached_view ,
+            )
+            return 
+        self ._schedule_project_refresh (project_id ,run_id ,show_status =False )
+
+    def _schedule_project_refresh(self, project_id: str, run_id: str, *, show_status: bool) -> None:
+        self._pending_project_refresh = (project_id, run_id, show_status)
+        self._project_refresh_timer.start()
+
+    def _cancel_project_refresh(self) -> None:
+        self._project_refresh_timer.stop()
+        self._pending_project_refresh = None
+
+    def _flush_project_refresh(self) -> None:
+        pending = self._pending_project_refresh
+        self._pending_project_refresh = None
+        if pending is None:
+            return
+        project_id, run_id, show_status = pending
+        self._refresh_project(project_id=project_id, preferred_run_id=run_id, show_status=show_status)
+
+    def _remember_run_view (
+    self ,
+    project_id :str ,
+    run_id :str |None ,
+    runs :list [ProcessingRun ],
+    run_view :dict [str ,Any ],
+    )->None :
+        if not run_id :
+            return 
+        run =next ((item for item in runs if str (item .id )==run_id ),None )
+        if run is None or run .status in {"scheduled","pending","running"}:
+            return 
+        if len (self ._run_view_cache )>=TIMELINE_CACHE_SIZE :
+            self ._run_view_cache .pop (next (iter (self ._run_view_cache )),None )
+        self ._run_view_cache [(project_id ,run_id )]=run_view 
 
     def _on_add_member_requested (self ,project_id :str ,user_login :str ,member_role :str )->None :
         self .project_view .set_loading (True ,"Добавляем участника...")
@@ -883,7 +1295,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _on_change_member_role_requested (self ,project_id :str ,user_id :str ,member_role :str )->None :
@@ -910,7 +1322,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _on_remove_member_requested (self ,project_id :str ,user_id :str )->None :
@@ -934,7 +1346,7 @@ class MainWindow (QMainWindow ):
         task ,
         on_result =on_success ,
         on_error =on_error ,
-        on_finished =lambda :self .project_view .set_loading (False ),
+        on_finished =self ._stop_project_loading ,
         )
 
     def _refresh_project (
@@ -953,75 +1365,112 @@ class MainWindow (QMainWindow ):
             self .project_view .set_loading (True ,"Загружаем данные проекта...")
 
         def task ()->dict [str ,Any ]:
-            project =self .client .get_project (project_id =project_id )
-            members =self .client .list_project_members (project_id =project_id ).items 
-            runs_page =self .client .list_processing_runs (project_id =project_id ,limit =50 ,offset =0 )
-            runs =list (runs_page .items )
-
-            selected_run_id =self ._resolve_selected_run_id (runs ,preferred_run_id =preferred_run_id )
-            if selected_run_id :
-                candidate =next ((run for run in runs if str (run .id )==selected_run_id ),None )
-                if candidate is not None and candidate .status in {"scheduled","pending","running"}:
-                    try :
-                        self .client .sync_processing_run (project_id =project_id ,run_id =selected_run_id )
-                        runs_page =self .client .list_processing_runs (project_id =project_id ,limit =50 ,offset =0 )
-                        runs =list (runs_page .items )
-                        selected_run_id =self ._resolve_selected_run_id (runs ,preferred_run_id =selected_run_id )
-                    except ApiError :
-                        pass 
-
-            original_video_path =self ._ensure_project_video_cached (project_id =project_id )
-            overlay_video_path :str |None =None 
-            video_timeline_points :list [dict [str ,Any ]]=[]
-            audio_timeline_points :list [dict [str ,Any ]]=[]
-            audio_feature_series :dict [str ,list [dict [str ,float ]]]={}
-
-            if selected_run_id :
-                try :
-                    artifacts =self .client .list_artifacts (project_id =project_id ,run_id =selected_run_id ).artifacts 
-                except ApiError :
-                    artifacts =[]
-
-                overlay_artifact =self ._select_artifact (
-                artifacts ,
-                artifact_type ="video",
-                path_hints =("overlay","processed"),
-                )
-                video_results_artifact =self ._select_artifact (
-                artifacts ,
-                artifact_type ="json",
-                path_hints =("results","emotion"),
-                )
-                audio_results_artifact =self ._select_audio_results_artifact (artifacts )
-
-                if overlay_artifact is not None :
-                    cached_overlay =self ._ensure_artifact_cached (
-                    project_id =project_id ,
-                    run_id =selected_run_id ,
-                    artifact =overlay_artifact ,
+            # Independent requests overlap; the original video download starts right away.
+            with ThreadPoolExecutor (max_workers =PROJECT_FETCH_WORKERS )as executor :
+                original_video_future =executor .submit (self ._ensure_project_video_cached ,project_id =project_id )
+
+                bundle =self ._fetch_project_bundle (project_id =project_id ,run_id =preferred_run_id or None )
+                if bundle is not None :
+                    project =bundle .project 
+                    members =bundle .members .items 
+                    runs =list (bundle .runs .items )
+                else :
+                    project_future =executor .submit (self .client .get_project ,project_id =project_id )
+                    members_future =executor .submit (self .client .list_project_members ,project_id =project_id )
+                    runs_future =executor .submit (self .client .list_processing_runs ,project_id =project_id ,limit =50 ,offset =0 )
+                    project =project_future .result ()
+                    members =members_future .result ().items 
+                    runs =list (runs_future .result ().items )
+
+                runs_by_id ={str (run .id ):run for run in runs }
+                selected_run_id =self ._resolve_selected_run_id (runs_by_id ,preferred_run_id =preferred_run_id )
+                if selected_run_id :
+                    candidate =runs_by_id .get (selected_run_id )
+                    if candidate is not None and candidate .status in {"scheduled","pending","running"}:
+                        try :
+                            synced_run =self .client .sync_and_get_processing_run (project_id =project_id ,run_id =selected_run_id )
+                            if synced_run is not None :
+                                runs =[synced_run if run .id ==synced_run .id else run for run in runs ]
+                            else :
+                                runs_page =self .client .list_processing_runs (project_id =project_id ,limit =50 ,offset =0 )
+                                runs =list (runs_page .items )
+                            runs_by_id ={str (run .id ):run for run in runs }
+                            selected_run_id =self ._resolve_selected_run_id (runs_by_id ,preferred_run_id =selected_run_id )
+                        except ApiError :
+                            pass 
+
+                overlay_video_path :str |None =None 
+                video_timeline_points :list [dict [str ,Any ]]=[]
+                audio_timeline_points :list [dict [str ,Any ]]=[]
+                audio_feature_series :dict [str ,list [dict [str ,float ]]]={}
+
+                if selected_run_id :
+                    if bundle is not None and bundle .artifacts is not None and bundle .artifacts_run_id ==selected_run_id :
+                        artifacts =bundle .artifacts .artifacts 
+                    else :
+                        try :
+                            artifacts =self .client .list_artifacts (project_id =project_id ,run_id =selected_run_id ).artifacts 
+                        except ApiError :
+                            artifacts =[]
+
+                    overlay_artifact =self ._select_artifact (
+                    artifacts ,
+                    artifact_type ="video",
+                    path_hints =("overlay","processed"),
+                    )
+                    video_results_artifact =self ._select_artifact (
+                    artifacts ,
+                    artifact_type ="json",
+                    path_hints =("results","emotion"),
                     )
-                    overlay_video_path =str (cached_overlay )
+                    audio_results_artifact =self ._select_audio_results_artifact (artifacts )
+
+                    def fetch_artifact (artifact :Artifact )->Path :
+                        return self ._ensure_artifact_cached (
+                        project_id =project_id ,
+                        run_id =selected_run_id ,
+                        artifact =artifact ,
+                        )
+
+                    def fetch_video_timeline (artifact :Artifact )->Any |None :
+                        return self ._cached_timeline (
+                        fetch_artifact (artifact ),
+                        "video",
+                        self ._extract_video_timeline_points ,
+                        )
+
+                    def fetch_audio_timeline (artifact :Artifact )->Any |None :
+                        return self ._cached_timeline (
+                        fetch_artifact (artifact ),
+                        "audio",
+                        self ._extract_audio_timeline ,
+                        )
 
-                if video_results_artifact is not None :
-                    cached_video_results =self ._ensure_artifact_cached (
-                    project_id =project_id ,
-                    run_id =selected_run_id ,
-                    artifact =video_results_artifact ,
+                    # The overlay video and both result files download concurrently.
+                    overlay_future =executor .submit (fetch_artifact ,overlay_artifact )if overlay_artifact is not None else None 
+                    video_results_future =(
+                    executor .submit (fetch_video_timeline ,video_results_artifact )
+                    if video_results_artifact is not None 
+                    else None 
                     )
-                    raw_video_payload =self ._load_json_payload (cached_video_results )
-                    if raw_video_payload is not None :
-                        video_timeline_points =self ._extract_video_timeline_points (raw_video_payload )
-
-                if audio_results_artifact is not None :
-                    cached_audio_results =self ._ensure_artifact_cached (
-                    project_id =project_id ,
-                    run_id =selected_run_id ,
-                    artifact =audio_results_artifact ,
+                    audio_results_future =(
+                    executor .submit (fetch_audio_timeline ,audio_results_artifact )
+                    if audio_results_artifact is not None 
+                    else None 
                     )
-                    raw_audio_payload =self ._load_json_payload (cached_audio_results )
-                    if raw_audio_payload is not None :
-                        audio_timeline_points =self ._extract_audio_timeline_points (raw_audio_payload )
-                        audio_feature_series =self ._extract_audio_feature_series (raw_audio_payload )
+
+                    if video_results_future is not None :
+                        video_timeline_points =video_results_future .result ()or []
+
+                    if audio_results_future is not None :
+                        audio_timeline =audio_results_future .result ()
+                        if audio_timeline is not None :
+                            audio_timeline_points ,audio_feature_series =audio_timeline 
+
+                    if overlay_future is not None :
+                        overlay_video_path =str (overlay_future .result ())
+
+                original_video_path =original_video_future .result ()
 
             return {
             "project":project ,
@@ -1038,20 +1487,26 @@ class MainWindow (QMainWindow ):
         def on_success (result :dict [str ,Any ])->None :
             self .current_project_id =project_id 
             self .current_project_run_id =str (result .get ("selected_run_id")or "")or None 
+            # These timeline lists and dicts are shared with _timeline_cache and _run_view_cache rather than
+            # copied, so they are read-only: mutating a point here or in ProjectView would corrupt both caches.
+            run_view ={
+            "video_timeline_points":result ["video_timeline_points"],
+            "audio_timeline_points":result ["audio_timeline_points"],
+            "audio_feature_series":result ["audio_feature_series"],
+            "original_video_path":str (result ["original_video_path"])if result ["original_video_path"]else None ,
+            "overlay_video_path":str (result ["overlay_video_path"])if result ["overlay_video_path"]else None ,
+            }
             self .project_view .set_project_data (
             project =result ["project"],
-            members =list (result ["members"]),
-            runs =list (result ["runs"]),
+            members =result ["members"],
+            runs =result ["runs"],
             selected_run_id =self .current_project_run_id ,
-            video_timeline_points =list (result ["video_timeline_points"]),
-            audio_timeline_points =list (result ["audio_timeline_points"]),
-            audio_feature_series =dict (result ["audio_feature_series"]),
-            original_video_path =str (result ["original_video_path"])if result ["original_video_path"]else None ,
-            overlay_video_path =str (result ["overlay_video_path"])if result ["overlay_video_path"]else None ,
+            **run_view ,
             )
+            self ._remember_run_view (project_id ,self .current_project_run_id ,result ["runs"],run_view )
             if show_status :
                 self .project_view .set_status_message (
-                f"Данные проекта обновлены: {datetime .now ().strftime ('%H:%M:%S')}",
+                f"Данные проекта обновлены: {strftime ('%H:%M:%S')}",
                 is_error =False ,
                 )
 
@@ -1073,15 +1528,27 @@ class MainWindow (QMainWindow ):
         on_finished =on_finished ,
         )
 
-    def _resolve_selected_run_id (self ,runs :list [ProcessingRun ],*,preferred_run_id :str )->str |None :
-        if not runs :
+    def _fetch_project_bundle (self ,*,project_id :str ,run_id :str |None )->ProjectBundle |None :
+        if not self ._project_bundle_supported :
+            return None 
+        try :
+            return self .client .get_project_bundle (project_id =project_id ,run_id =run_id )
+        except ApiError as exc :
+            if exc .status_code not in {404 ,405 }:
+                raise 
+            # The route depends on the project, so a 404 can also mean just this project is gone. Only the
+            # framework's bare "Not Found" (no error code) or 405 says the server has no bundle route at all.
+            if exc .status_code ==405 or (exc .code is None and exc .message =="Not Found"):
+                self ._project_bundle_supported =False 
             return None 
 
+    def _resolve_selected_run_id (self ,runs_by_id :dict [str ,ProcessingRun ],*,preferred_run_id :str )->str |None :
         preferred =preferred_run_id .strip ()
-        if preferred and any (str (run .id )==preferred for run in runs ):
+        if preferred and preferred in runs_by_id :
             return preferred 
 
-        return str (runs [0 ].id )
+        # Dicts keep insertion order, so this is still the first run of the page.
+        return next (iter (runs_by_id ),None )
 
     def _project_cache_dir (self ,project_id :str )->Path :
         path =self .config .app_data_dir /"projects"/project_id 
@@ -1091,8 +1558,10 @@ class MainWindow (QMainWindow ):
     def _ensure_project_video_cached (self ,*,project_id :str )->str |None :
         cache_dir =self ._project_cache_dir (project_id )
         target =cache_dir /"original_video.mp4"
-        if not target .exists ()or target .stat ().st_size ==0 :
-            self .client .download_project_video (project_id =project_id ,target_path =target )
+        self ._download_once (
+        target ,
+        partial (self .client .download_project_video ,project_id =project_id ,target_path =target ),
+        )
         return str (target )
 
     def _ensure_artifact_cached (self ,*,project_id :str ,run_id :str ,artifact :Artifact )->Path :
@@ -1101,15 +1570,42 @@ class MainWindow (QMainWindow ):
 
         artifact_name =Path (artifact .path ).name .strip ()or f"{artifact .artifact_id }.bin"
         target =run_dir /artifact_name 
-        if not target .exists ()or target .stat ().st_size ==0 :
-            self .client .download_artifact (
-            project_id =project_id ,
-            artifact_id =artifact .artifact_id ,
-            run_id =run_id ,
-            target_path =target ,
-            )
+        self ._download_once (
+        target ,
+        partial (
+        self .client .download_artifact ,
+        project_id =project_id ,
+        artifact_id =artifact .artifact_id ,
+        run_id =run_id ,
+        target_path =target ,
+        ),
+        )
         return target 
 
+    def _download_once (self ,target :Path ,download :Callable [[],Any ])->None :
+        """Download into target unless it is cached; concurrent callers for one target share a single transfer."""
+        with self ._downloads_lock :
+            pending =self ._inflight_downloads .get (target )
+            is_owner =pending is None 
+            if is_owner :
+                pending =Future ()
+                self ._inflight_downloads [target ]=pending 
+        if not is_owner :
+            pending .result ()
+            return 
+
+        try :
+            if not target .exists ()or target .stat ().st_size ==0 :
+                download ()
+        except BaseException as exc :
+            pending .set_exception (exc )
+            raise 
+        else :
+            pending .set_result (None )
+        finally :
+            with self ._downloads_lock :
+                self ._inflight_downloads .pop (target ,None )
+
     def _select_artifact (
     self ,
     artifacts :list [Artifact ],
@@ -1117,68 +1613,84 @@ class MainWindow (QMainWindow ):
     artifact_type :str ,
     path_hints :tuple [str ,...]=(),
     )->Artifact |None :
-        candidates =[item for item in artifacts if item .type .lower ()==artifact_type .lower ()]
+        lowered_type =artifact_type .lower ()
+        candidates =[(item ,item .path .lower ())for item in artifacts if item .type .lower ()==lowered_type ]
         if not candidates :
             return None 
 
         for hint in path_hints :
             lowered_hint =hint .lower ()
-            for item in candidates :
-                if lowered_hint in item .path .lower ():
+            for item ,lowered_path in candidates :
+                if lowered_hint in lowered_path :
                     return item 
-        return candidates [0 ]
+        return candidates [0 ][0 ]
 
     def _select_audio_results_artifact (self ,artifacts :list [Artifact ])->Artifact |None :
         if not artifacts :
             return None 
 
-        explicit_audio_hints =(
-        "audio_result_remote",
-        "audio_result",
-        "audio_solution",
-        "audio_report",
-        "audio/",
-        "/audio_",
-        )
+        # Each path and type is lowered once; the explicit matches carry their ranking key along.
+        lowered =[(item ,item .path .lower (),item .type .lower ())for item in artifacts ]
 
         explicit =[
-        item 
-        for item in artifacts 
-        if any (hint in item .path .lower ()for hint in explicit_audio_hints )
-        and item .type .lower ()in {"audio_json","json"}
+        (
+        (
+        0 if lowered_type =="audio_json"else 1 ,
+        0 if "audio_result_remote"in lowered_path else 1 ,
+        0 if "audio_result"in lowered_path else 1 ,
+        ),
+        index ,
+        item ,
+        )
+        for index ,(item ,lowered_path ,lowered_type )in enumerate (lowered )
+        if lowered_type in {"audio_json","json"}
+        and any (hint in lowered_path for hint in AUDIO_RESULT_PATH_HINTS )
         ]
         if explicit :
-            explicit .sort (
-            key =lambda item :(
-            0 if item .type .lower ()=="audio_json"else 1 ,
-            0 if "audio_result_remote"in item .path .lower ()else 1 ,
-            0 if "audio_result"in item .path .lower ()else 1 ,
-            )
-            )
-            return explicit [0 ]
+            return min (explicit )[2 ]
 
-        type_audio_json =[item for item in artifacts if item .type .lower ()=="audio_json"]
-        if type_audio_json :
-            return type_audio_json [0 ]
+        for item ,_lowered_path ,lowered_type in lowered :
+            if lowered_type =="audio_json":
+                return item 
 
             # Last resort: JSON artifact whose path clearly indicates audio payload.
-        json_audio =[
-        item 
-        for item in artifacts 
-        if item .type .lower ()=="json"
-        and "audio"in item .path .lower ()
-        and "results.json"not in item .path .lower ()
-        ]
-        if json_audio :
-            return json_audio [0 ]
+        for item ,lowered_path ,lowered_type in lowered :
+            if lowered_type =="json"and "audio"in lowered_path and "results.json"not in lowered_path :
+                return item 
         return None 
 
+    def _cached_timeline (self ,results_path :Path ,kind :str ,build :Callable [[Any ],Any ])->Any |None :
+        """Parse a results file once per (path, mtime, size) and reuse what was built from it."""
+        try :
+            stat =results_path .stat ()
+        except OSError :
+            return None 
+        key =(str (results_path ),stat .st_mtime_ns ,stat .st_size ,kind )
+        with self ._timeline_cache_lock :
+            cached =self ._timeline_cache .get (key )
+        if cached is not None :
+            return cached 
+        raw_payload =self ._load_json_payload (results_path )
+        if raw_payload is None :
+            return None 
+        cached =build (raw_payload )
+        with self ._timeline_cache_lock :
+            if len (self ._timeline_cache )>=TIMELINE_CACHE_SIZE :
+                self ._timeline_cache .pop (next (iter (self ._timeline_cache )),None )
+            self ._timeline_cache [key ]=cached 
+        return cached 
+
     @staticmethod 
     def _load_json_payload (results_path :Path )->Any |None :
         if not results_path .exists ():
             return None 
         try :
-            return json .loads (results_path .read_text (encoding ="utf-8"))
+            if orjson is not None :
+                # orjson parses straight from the mapped pages, so large results are never copied into a bytes object.
+                with results_path .open ("rb")as handle ,mmap .mmap (handle .fileno (),0 ,access =mmap .ACCESS_READ )as mapped :
+                    with memoryview (mapped )as view :
+                        return orjson .loads (view )
+            return json .loads (results_path .read_bytes ())
         except (OSError ,ValueError ):
             return None 
 
@@ -1189,32 +1701,29 @@ class MainWindow (QMainWindow ):
         if not isinstance (raw_payload ,dict ):
             return []
 
-        direct_frames =raw_payload .get ("frames")
-        if isinstance (direct_frames ,list ):
-            return [item for item in direct_frames if isinstance (item ,dict )]
-
-        direct_results =raw_payload .get ("results")
-        if isinstance (direct_results ,list ):
-            return [item for item in direct_results if isinstance (item ,dict )]
-
         nested_result =raw_payload .get ("result")
-        if isinstance (nested_result ,dict ):
-            nested_frames =nested_result .get ("frames")
-            if isinstance (nested_frames ,list ):
-                return [item for item in nested_frames if isinstance (item ,dict )]
-            nested_results =nested_result .get ("results")
-            if isinstance (nested_results ,list ):
-                return [item for item in nested_results if isinstance (item ,dict )]
-
+        containers =(raw_payload ,nested_result )if isinstance (nested_result ,dict )else (raw_payload ,)
+        for container in containers :
+            for key in FRAME_PAYLOAD_KEYS :
+                frames =container .get (key )
+                if isinstance (frames ,list ):
+                    return [item for item in frames if isinstance (item ,dict )]
         return []
 
     def _extract_video_timeline_points (self ,raw_payload :Any )->list [dict [str ,Any ]]:
         frames =self ._extract_frames_payload (raw_payload )
         return self ._build_probability_timeline (frames ,prefer_risk =False )
 
-    def _extract_audio_timeline_points (self ,raw_payload :Any )->list [dict [str ,Any ]]:
+    def _extract_audio_timeline (
+    self ,
+    raw_payload :Any ,
+    )->tuple [list [dict [str ,Any ]],dict [str ,list [dict [str ,float ]]]]:
+        # Risk points and feature series come from the same frames, so they are extracted once.
         frames =self ._extract_frames_payload (raw_payload )
-        return self ._build_probability_timeline (frames ,prefer_risk =True )
+        return (
+        self ._build_probability_timeline (frames ,prefer_risk =True ),
+        self ._build_audio_feature_series (frames ),
+        )
 
     @staticmethod
     def _normalize_probability (raw_value :Any )->float :
@@ -1225,8 +1734,7 @@ class MainWindow (QMainWindow ):
             value =value /100.0
         return max (0.0 ,min (1.0 ,value ))
 
-    def _extract_audio_feature_series (self ,raw_payload :Any )->dict [str ,list [dict [str ,float ]]]:
-        frames =self ._extract_frames_payload (raw_payload )
+    def _build_audio_feature_series (self ,frames :list [dict [str ,Any ]])->dict [str ,list [dict [str ,float ]]]:
         result :dict [str ,list [dict [str ,float ]]]={}
 
         for item in frames :
@@ -1282,8 +1790,10 @@ class MainWindow (QMainWindow ):
                 {"time":frame_time ,"value":numeric_value }
                 )
 
+        # Frame times come out of _extract_frame_time as floats already.
+        by_time =itemgetter ("time")
         for points in result .values ():
-            points .sort (key =lambda item :safe_float (item .get ("time"),0.0 ))
+            points .sort (key =by_time )
 
         return {name :points for name ,points in sorted (result .items (),key =lambda item :item [0 ].lower ())}
 
@@ -1342,68 +1852,54 @@ class MainWindow (QMainWindow ):
             for ts ,probs in timestamp_based :
                 points .append ({"time":max (0.0 ,ts -base_ts ),"probabilities":probs })
 
-        points .sort (key =lambda item :safe_float (item .get ("time"),0.0 ))
+        points .sort (key =itemgetter ("time"))
         if not points :
             return []
 
-        all_series =sorted (
-        {
-        name 
-        for item in points 
-        for name in item .get ("probabilities",{}).keys ()
-        if isinstance (item .get ("probabilities"),dict )
-        }
-        )
-        if not all_series :
-            return []
+        # Every point was built above with a non-empty probabilities dict.
+        series_names :set [str ]=set ()
+        for item in points :
+            series_names .update (item ["probabilities"])
+        all_series =tuple (sorted (series_names ))
 
         for item in points :
-            probs =item .get ("probabilities")
-            if not isinstance (probs ,dict ):
-                continue 
+            probs =item ["probabilities"]
             for series_name in all_series :
                 probs .setdefault (series_name ,0.0 )
 
         if len (points )==1 :
             return points 
 
-        deltas :list [float ]=[]
-        for idx in range (1 ,len (points )):
-            delta =safe_float (points [idx ]["time"])-safe_float (points [idx -1 ]["time"])
-            if delta >0 :
-                deltas .append (delta )
+        # Point times are already floats and probabilities already normalized, so both are read once up front.
+        times =[item ["time"]for item in points ]
+        deltas =[later -earlier for earlier ,later in zip (times ,times [1 :])if later >earlier ]
 
         step =0.2 
         if deltas :
             deltas .sort ()
             step =max (0.05 ,min (1.0 ,deltas [len (deltas )//2 ]))
 
-        max_time =max (safe_float (item ["time"])for item in points )
+        source_probs =[
+        {name :item ["probabilities"][name ]for name in all_series }
+        for item in points 
+        ]
+        max_time =max (times )
+        last_index =len (points )-1 
         densified :list [dict [str ,Any ]]=[]
         source_index =0 
-        current_probs =dict (points [0 ]["probabilities"])
+        current_probs =source_probs [0 ]
         t =0.0 
 
         while t <=max_time +1e-6 :
-            while source_index +1 <len (points )and safe_float (points [source_index +1 ]["time"])<=t :
+            while source_index <last_index and times [source_index +1 ]<=t :
                 source_index +=1 
-                current_probs =dict (points [source_index ]["probabilities"])
+                current_probs =source_probs [source_index ]
 
-            densified .append (
-            {
-            "time":round (t ,3 ),
-            "probabilities":{name :self ._normalize_probability (current_probs .get (name ))for name in all_series },
-            }
-            )
+            densified .append ({"time":round (t ,3 ),"probabilities":dict (current_probs )})
             t +=step 
 
-        if safe_float (densified [-1 ]["time"])<max_time :
-            densified .append (
-            {
-            "time":round (max_time ,3 ),
-            "probabilities":{name :self ._normalize_probability (current_probs .get (name ))for name in all_series },
-            }
-            )
+        if densified [-1 ]["time"]<max_time :
+            densified .append ({"time":round (max_time ,3 ),"probabilities":dict (current_probs )})
 
         return densified 
 
@@ -1427,9 +1923,24 @@ class MainWindow (QMainWindow ):
         self .current_user =None 
         self .current_project_id =None 
         self .current_project_run_id =None 
+        self._broadcast_user_state = None
+        self._applied_models = None
+        self._applied_detectors = None
+        self._applied_audio_providers = None
         self._is_refreshing_dashboard = False
         self._is_refreshing_admin = False
         self._is_refreshing_project = False
+        self._dashboard_loading_tokens.clear()
+        self._admin_loading_tokens.clear()
+        self._admin_filter_timer.stop()
+        self._cancel_project_refresh()
+        self._dashboard_refresh_generation += 1
+        self._admin_refresh_generation += 1
+        self._prefetched_dashboard = None
+        self._metadata_cache.clear()
+        with self._timeline_cache_lock:
+            self._timeline_cache.clear()
+        self._run_view_cache.clear()
         self ._available_models =[]
         self ._available_detectors =["haar","mtcnn","retinaface","scrfd"]
         self ._available_audio_providers =[]
@@ -1440,7 +1951,7 @@ class MainWindow (QMainWindow ):
         self ._admin_users_active =None 
         self ._admin_projects_query =""
         self .client .clear_session_token ()
-        self .session_store .clear ()
+        self ._clear_persisted_session ()
 
     def _format_error (self ,error :Exception )->str :
         if isinstance (error ,ApiError ):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QFrame,
@@ -16,6 +16,32 @@ from PyQt6.QtWidgets import (
 
 from gme_app.models import UserProfile, format_datetime
 
+STATUS_ERROR_STYLE = "color: #c63f57;"
+STATUS_INFO_STYLE = "color: #4d5a86;"
+ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight
+ALIGN_LEFT_TOP = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+ECHO_PASSWORD = QLineEdit.EchoMode.Password
+SUBMIT_THROTTLE_MS = 300
+
+
+def _add_labeled_input(
+    layout: QVBoxLayout,
+    label_text: str,
+    *,
+    placeholder: str | None = None,
+    echo_mode: QLineEdit.EchoMode | None = None,
+) -> QLineEdit:
+    # Field captions are plain labels with no object name, so no stylesheet rule has to match them.
+    layout.addWidget(QLabel(label_text))
+    line_edit = QLineEdit()
+    if placeholder:
+        line_edit.setPlaceholderText(placeholder)
+    if echo_mode is not None:
+        line_edit.setEchoMode(echo_mode)
+    layout.addWidget(line_edit)
+    return line_edit
+
 
 class ProfileView(QWidget):
     back_to_projects_requested = pyqtSignal()
@@ -26,10 +52,25 @@ class ProfileView(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._user: UserProfile | None = None
+        self._status_is_error: bool | None = None
+        self._status_visible = False
+        self._admin_visible = False
+        self._summary_key: tuple[object, ...] | None = None
+        # Swallows the second click of a double-click before the controller has set the loading state.
+        self._submit_throttle = QTimer(self)
+        self._submit_throttle.setSingleShot(True)
+        self._submit_throttle.setInterval(SUBMIT_THROTTLE_MS)
+        # The password card is built on first use; most profile visits never open it.
+        self._password_card: QFrame | None = None
+        self.old_password_input: QLineEdit | None = None
+        self.new_password_input: QLineEdit | None = None
+        self.revoke_sessions_checkbox: QCheckBox | None = None
+        self.change_password_button: QPushButton | None = None
         self._build_ui()
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
+        self._root_layout = root
         root.setContentsMargins(18, 16, 18, 16)
         root.setSpacing(12)
 
@@ -45,12 +86,12 @@ class ProfileView(QWidget):
 
         self.open_projects_button = QPushButton("Проекты")
         self.open_projects_button.setObjectName("SecondaryButton")
-        self.open_projects_button.clicked.connect(self.back_to_projects_requested.emit)
+        self.open_projects_button.clicked.connect(self.back_to_projects_requested)
         header_layout.addWidget(self.open_projects_button, 0)
 
         self.open_admin_button = QPushButton("Админ-панель")
         self.open_admin_button.setObjectName("SecondaryButton")
-        self.open_admin_button.clicked.connect(self.open_admin_requested.emit)
+        self.open_admin_button.clicked.connect(self.open_admin_requested)
         self.open_admin_button.hide()
         header_layout.addWidget(self.open_admin_button, 0)
 
@@ -63,7 +104,7 @@ class ProfileView(QWidget):
 
         self.user_summary = QLabel("-")
         self.user_summary.setObjectName("SectionHint")
-        self.user_summary.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.user_summary.setAlignment(ALIGN_LEFT_TOP)
         root.addWidget(self.user_summary, 0)
 
         profile_card = QFrame()
@@ -76,23 +117,25 @@ class ProfileView(QWidget):
         profile_title.setObjectName("ProjectTitle")
         profile_layout.addWidget(profile_title)
 
-        profile_layout.addWidget(QLabel("Отображаемое имя"))
-        self.display_name_input = QLineEdit()
-        self.display_name_input.setPlaceholderText("Как отображать ваше имя")
-        profile_layout.addWidget(self.display_name_input)
-
-        profile_layout.addWidget(QLabel("Эл. почта"))
-        self.email_input = QLineEdit()
-        self.email_input.setPlaceholderText("name@example.com")
-        profile_layout.addWidget(self.email_input)
+        self.display_name_input = _add_labeled_input(
+            profile_layout, "Отображаемое имя", placeholder="Как отображать ваше имя"
+        )
+        self.email_input = _add_labeled_input(profile_layout, "Эл. почта", placeholder="name@example.com")
 
         self.save_profile_button = QPushButton("Сохранить профиль")
         self.save_profile_button.setObjectName("PrimaryButton")
         self.save_profile_button.clicked.connect(self._emit_save_profile)
-        profile_layout.addWidget(self.save_profile_button, 0, Qt.AlignmentFlag.AlignRight)
+        profile_layout.addWidget(self.save_profile_button, 0, ALIGN_RIGHT)
 
         root.addWidget(profile_card, 0)
 
+        self.show_password_button = QPushButton("Сменить пароль…")
+        self.show_password_button.setObjectName("SecondaryButton")
+        self.show_password_button.clicked.connect(self._expand_password_card)
+        root.addWidget(self.show_password_button, 0, ALIGN_LEFT)
+        root.addStretch(1)
+
+    def _build_password_card(self) -> QFrame:
         password_card = QFrame()
         password_card.setObjectName("DetailCard")
         password_layout = QVBoxLayout(password_card)
@@ -103,15 +146,8 @@ class ProfileView(QWidget):
         password_title.setObjectName("ProjectTitle")
         password_layout.addWidget(password_title)
 
-        password_layout.addWidget(QLabel("Старый пароль"))
-        self.old_password_input = QLineEdit()
-        self.old_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        password_layout.addWidget(self.old_password_input)
-
-        password_layout.addWidget(QLabel("Новый пароль"))
-        self.new_password_input = QLineEdit()
-        self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        password_layout.addWidget(self.new_password_input)
+        self.old_password_input = _add_labeled_input(password_layout, "Старый пароль", echo_mode=ECHO_PASSWORD)
+        self.new_password_input = _add_labeled_input(password_layout, "Новый пароль", echo_mode=ECHO_PASSWORD)
 
         self.revoke_sessions_checkbox = QCheckBox("Завершить остальные сессии")
         self.revoke_sessions_checkbox.setChecked(True)
@@ -120,55 +156,84 @@ class ProfileView(QWidget):
         self.change_password_button = QPushButton("Обновить пароль")
         self.change_password_button.setObjectName("PrimaryButton")
         self.change_password_button.clicked.connect(self._emit_change_password)
-        password_layout.addWidget(self.change_password_button, 0, Qt.AlignmentFlag.AlignRight)
+        password_layout.addWidget(self.change_password_button, 0, ALIGN_RIGHT)
 
-        root.addWidget(password_card, 0)
-        root.addStretch(1)
+        return password_card
+
+    def _expand_password_card(self) -> None:
+        if self._password_card is not None:
+            return
+        password_card = self._build_password_card()
+        index = self._root_layout.indexOf(self.show_password_button)
+        self._root_layout.insertWidget(index, password_card, 0)
+        self._root_layout.removeWidget(self.show_password_button)
+        self.show_password_button.deleteLater()
+        self._password_card = password_card
+        self.old_password_input.setFocus()
 
     def set_user(self, user: UserProfile) -> None:
         self._user = user
-        self.display_name_input.setText((user.display_name or "").strip())
-        self.email_input.setText((user.email or "").strip())
+        with QSignalBlocker(self.display_name_input), QSignalBlocker(self.email_input):
+            self.display_name_input.setText((user.display_name or "").strip())
+            self.email_input.setText((user.email or "").strip())
+        summary_key = (user.login, user.role, user.created_at)
+        if summary_key == self._summary_key:
+            return
+        self._summary_key = summary_key
         created_text = format_datetime(user.created_at)
         self.user_summary.setText(
             f"Логин: {user.login}   |   Роль: {user.role}   |   Аккаунт создан: {created_text}"
         )
 
     def set_admin_mode(self, is_admin: bool) -> None:
+        if is_admin == self._admin_visible:
+            return
+        self._admin_visible = is_admin
         self.open_admin_button.setVisible(is_admin)
 
     def set_loading(self, loading: bool, message: str | None = None) -> None:
-        self.open_projects_button.setDisabled(loading)
-        self.open_admin_button.setDisabled(loading)
-        self.save_profile_button.setDisabled(loading)
-        self.change_password_button.setDisabled(loading)
-        self.display_name_input.setDisabled(loading)
-        self.email_input.setDisabled(loading)
-        self.old_password_input.setDisabled(loading)
-        self.new_password_input.setDisabled(loading)
-        self.revoke_sessions_checkbox.setDisabled(loading)
+        # Nothing on this screen stays usable while a request runs, so the whole view is
+        # disabled and Qt cascades the state to every child, including a later-built password card.
+        self.setDisabled(loading)
         if loading and message:
             self.set_status_message(message, is_error=False)
 
     def clear_password_inputs(self) -> None:
-        self.old_password_input.clear()
-        self.new_password_input.clear()
+        if self._password_card is None:
+            return
+        with QSignalBlocker(self.old_password_input), QSignalBlocker(self.new_password_input):
+            self.old_password_input.clear()
+            self.new_password_input.clear()
 
     def set_status_message(self, message: str, *, is_error: bool) -> None:
         if not message:
-            self.status_message.hide()
-            self.status_message.clear()
+            if self._status_visible:
+                self.status_message.hide()
+                self.status_message.clear()
+                self._status_visible = False
             return
-        self.status_message.setStyleSheet("color: #c63f57;" if is_error else "color: #4d5a86;")
+        if is_error != self._status_is_error:
+            # Setting a stylesheet re-parses it, so only do it when the colour actually flips.
+            self.status_message.setStyleSheet(STATUS_ERROR_STYLE if is_error else STATUS_INFO_STYLE)
+            self._status_is_error = is_error
         self.status_message.setText(message)
-        self.status_message.show()
+        if not self._status_visible:
+            self.status_message.show()
+            self._status_visible = True
+
+    def _accept_submit(self) -> bool:
+        if self._submit_throttle.isActive():
+            return False
+        self._submit_throttle.start()
+        return True
 
     def _emit_save_profile(self) -> None:
-        email_raw = self.email_input.text().strip()
-        display_name_raw = self.display_name_input.text().strip()
-        email_value = email_raw or None
-        display_name_value = display_name_raw or None
-        self.save_profile_requested.emit(email_value, display_name_value)
+        if not self._accept_submit():
+            return
+        self.save_profile_requested.emit(
+            self.email_input.text().strip() or None,
+            self.display_name_input.text().strip() or None,
+        )
 
     def _emit_change_password(self) -> None:
         old_password = self.old_password_input.text()
@@ -177,4 +242,6 @@ class ProfileView(QWidget):
         if not old_password or not new_password:
             self.set_status_message("Заполните старый и новый пароль.", is_error=True)
             return
+        if not self._accept_submit():
+            return
         self.change_password_requested.emit(old_password, new_password, revoke)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import Qt, QRect, QSize, QTimer, QUrl, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PyQt6.QtCore import Qt, QPoint, QRect, QSignalBlocker, QSize, QTimer, QUrl, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QPolygon
 from PyQt6.QtGui import QPageLayout, QPageSize, QPdfWriter
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QVideoWidget
@@ -150,6 +153,8 @@ LIE_RISK_KEYS: tuple[str, ...] = (
     "lie_score",
     "lie",
 )
+# Membership checks use the set; LIE_RISK_KEYS keeps the lookup priority order.
+LIE_RISK_KEY_SET: frozenset[str] = frozenset(LIE_RISK_KEYS)
 
 LIE_RISK_THRESHOLD = 0.65
 VIDEO_SEEK_STEP_SECONDS = 5.0
@@ -190,6 +195,37 @@ def format_seconds(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def build_polyline(points: list[tuple[int, int]]) -> QPolygon:
+    return QPolygon([QPoint(x, y) for x, y in points])
+
+
+def draw_polyline(painter: QPainter, polyline: QPolygon, pen: QPen, point_pen: QPen | None = None) -> None:
+    if polyline.size() == 1:
+        painter.setPen(point_pen or pen)
+        painter.drawPoint(polyline.point(0))
+    elif polyline.size() > 1:
+        painter.setPen(pen)
+        painter.drawPolyline(polyline)
+
+
+def coalesced_update_timer(widget: QWidget) -> QTimer:
+    # Setters restart this zero-interval timer, so several data changes in one event-loop turn paint once.
+    timer = QTimer(widget)
+    timer.setSingleShot(True)
+    timer.setInterval(0)
+    timer.timeout.connect(widget.update)
+    return timer
+
+
+def timeline_cursor_rect(plot_rect: QRect, max_time: float, selected_time: float | None) -> QRect | None:
+    if selected_time is None or plot_rect.isEmpty():
+        return None
+    selected_ratio = selected_time / max_time if max_time > 0 else 0.0
+    selected_x = int(plot_rect.left() + plot_rect.width() * selected_ratio)
+    return QRect(selected_x - 2, plot_rect.top() - 1, 5, plot_rect.height() + 2)
+
+
+@lru_cache(maxsize=1024)
 def emotion_label_ru(name: str) -> str:
     key = str(name).strip().lower()
     if not key:
@@ -197,6 +233,7 @@ def emotion_label_ru(name: str) -> str:
     return EMOTION_LABELS_RU.get(key, key.replace("_", " ").capitalize())
 
 
+@lru_cache(maxsize=1024)
 def feature_label_ru(name: str) -> str:
     key = str(name).strip().lower()
     if not key:
@@ -225,15 +262,23 @@ class EmotionTimelineWidget(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setMinimumHeight(320)
-        self._points: list[dict[str, Any]] = []
+        # Column layout: one sorted time axis plus an aligned probability list per plotted emotion.
+        self._times: list[float] = []
+        self._series: dict[str, list[float]] = {}
         self._emotions: list[str] = []
         self._max_time = 1.0
         self._selected_time: float | None = None
         self._plot_rect = QRect()
+        # Screen-space polylines, rebuilt only when the data or the plot rectangle changes.
+        self._polylines: dict[str, QPolygon] = {}
+        self._polyline_rect = QRect()
+        self._update_timer = coalesced_update_timer(self)
 
     def set_points(self, points: list[dict[str, Any]]) -> None:
-        normalized: list[dict[str, Any]] = []
-        emotion_scores: defaultdict[str, list[float]] = defaultdict(list)
+        samples: list[tuple[float, dict[str, float]]] = []
+        # Running totals per emotion; only the mean is needed to rank them.
+        score_sums: dict[str, float] = {}
+        score_counts: Counter[str] = Counter()
 
         for item in points:
             if not isinstance(item, dict):
@@ -250,29 +295,31 @@ class EmotionTimelineWidget(QWidget):
                     continue
                 probability = normalize_probability(value)
                 probs[name] = probability
-                emotion_scores[name].append(probability)
+                score_sums[name] = score_sums.get(name, 0.0) + probability
+                score_counts[name] += 1
 
             if not probs:
                 continue
 
-            normalized.append({"time": current_time, "probabilities": probs})
+            samples.append((current_time, probs))
 
-        normalized.sort(key=lambda item: safe_float(item.get("time"), 0.0))
-        self._points = normalized
+        samples.sort(key=itemgetter(0))
 
-        if emotion_scores:
-            ordered = sorted(
-                emotion_scores.items(),
-                key=lambda item: sum(item[1]) / max(1, len(item[1])),
-                reverse=True,
-            )
-            self._emotions = [name for name, _ in ordered[:6]]
+        if score_sums:
+            self._emotions = heapq.nlargest(6, score_sums, key=lambda name: score_sums[name] / score_counts[name])
         else:
             self._emotions = ["unknown"]
 
-        self._max_time = max(1.0, max((safe_float(item.get("time"), 0.0) for item in normalized), default=1.0))
+        self._times = [current_time for current_time, _ in samples]
+        self._series = {
+            emotion: [probs.get(emotion, 0.0) for _, probs in samples]
+            for emotion in self._emotions
+        }
+        self._max_time = max(1.0, self._times[-1] if self._times else 1.0)
+        self._polylines = {}
+        self._polyline_rect = QRect()
         self._selected_time = None
-        self.update()
+        self._update_timer.start()
 
     def visible_series(self) -> list[str]:
         return list(self._emotions)
@@ -299,7 +346,7 @@ class EmotionTimelineWidget(QWidget):
         painter.setPen(QPen(QColor("#cfd8f4"), 1))
         painter.drawRect(self._plot_rect)
 
-        if not self._points:
+        if not self._times:
             painter.setPen(QColor("#64748b"))
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Нет данных для графика")
             return
@@ -328,36 +375,13 @@ class EmotionTimelineWidget(QWidget):
             value = self._max_time * ratio
             painter.drawText(x - 14, self._plot_rect.bottom() + 18, format_seconds(value))
 
+        if not event.rect().intersects(self._plot_rect):
+            return
+        if self._polyline_rect != self._plot_rect:
+            self._rebuild_polylines()
         for emotion in self._emotions:
             color = EMOTION_COLORS.get(emotion, QColor("#0ea5e9"))
-            line_points: list[tuple[int, int]] = []
-
-            for item in self._points:
-                time_sec = min(self._max_time, max(0.0, safe_float(item.get("time"), 0.0)))
-                probs = item.get("probabilities")
-                if not isinstance(probs, dict):
-                    continue
-                probability = normalize_probability(probs.get(emotion))
-
-                x_ratio = time_sec / self._max_time if self._max_time > 0 else 0.0
-                x = int(self._plot_rect.left() + self._plot_rect.width() * x_ratio)
-                y = int(self._plot_rect.bottom() - self._plot_rect.height() * probability)
-                line_points.append((x, y))
-
-            if len(line_points) == 1:
-                painter.setPen(QPen(color, 3))
-                painter.drawPoint(line_points[0][0], line_points[0][1])
-                continue
-
-            if len(line_points) > 1:
-                painter.setPen(QPen(color, 2))
-                for idx in range(len(line_points) - 1):
-                    painter.drawLine(
-                        line_points[idx][0],
-                        line_points[idx][1],
-                        line_points[idx + 1][0],
-                        line_points[idx + 1][1],
-                    )
+            draw_polyline(painter, self._polylines[emotion], QPen(color, 2), QPen(color, 3))
 
         if self._selected_time is not None:
             selected_ratio = self._selected_time / self._max_time if self._max_time > 0 else 0.0
@@ -365,16 +389,33 @@ class EmotionTimelineWidget(QWidget):
             painter.setPen(QPen(QColor("#ef4444"), 2))
             painter.drawLine(selected_x, self._plot_rect.top(), selected_x, self._plot_rect.bottom())
 
+    def _rebuild_polylines(self) -> None:
+        x_scale = self._plot_rect.width() / self._max_time if self._max_time > 0 else 0.0
+        x_positions = [int(self._plot_rect.left() + time_sec * x_scale) for time_sec in self._times]
+        bottom_edge = self._plot_rect.bottom()
+        height = self._plot_rect.height()
+        self._polylines = {
+            emotion: build_polyline(
+                [(x, int(bottom_edge - height * probability)) for x, probability in zip(x_positions, series)]
+            )
+            for emotion, series in self._series.items()
+        }
+        self._polyline_rect = QRect(self._plot_rect)
+
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
-        if not self._points or not self._plot_rect.contains(event.pos()):
+        if not self._times or not self._plot_rect.contains(event.pos()):
             return
 
         ratio = (event.position().x() - self._plot_rect.left()) / max(1, self._plot_rect.width())
         ratio = max(0.0, min(1.0, ratio))
         second = ratio * self._max_time
+        previous_cursor = timeline_cursor_rect(self._plot_rect, self._max_time, self._selected_time)
         self._selected_time = second
         self.time_clicked.emit(second)
-        self.update()
+        # Only the old and new cursor columns need repainting.
+        if previous_cursor is not None:
+            self.update(previous_cursor)
+        self.update(timeline_cursor_rect(self._plot_rect, self._max_time, second))
 
 
 class MetricTimelineWidget(QWidget):
@@ -391,6 +432,9 @@ class MetricTimelineWidget(QWidget):
         self._max_value = 1.0
         self._selected_time: float | None = None
         self._plot_rect = QRect()
+        self._polyline = QPolygon()
+        self._polyline_rect = QRect()
+        self._update_timer = coalesced_update_timer(self)
 
     @staticmethod
     def line_color() -> QColor:
@@ -423,8 +467,9 @@ class MetricTimelineWidget(QWidget):
             self._min_value = 0.0
             self._max_value = 1.0
 
+        self._polyline_rect = QRect()
         self._selected_time = None
-        self.update()
+        self._update_timer.start()
 
     def render_to_pixmap(self) -> QPixmap:
         pixmap = QPixmap(self.size())
@@ -472,26 +517,21 @@ class MetricTimelineWidget(QWidget):
             painter.drawText(x - 14, self._plot_rect.bottom() + 16, format_seconds(self._max_time * ratio))
             painter.setPen(QPen(QColor("#e2e8f0"), 1))
 
-        chart_points: list[tuple[int, int]] = []
-        value_span = self._max_value - self._min_value
-        for t, v in self._points:
-            x_ratio = t / self._max_time if self._max_time > 0 else 0.0
-            y_ratio = (v - self._min_value) / value_span if value_span > 0 else 0.5
-            x = int(self._plot_rect.left() + self._plot_rect.width() * x_ratio)
-            y = int(self._plot_rect.bottom() - self._plot_rect.height() * y_ratio)
-            chart_points.append((x, y))
-
-        painter.setPen(QPen(self.line_color(), 2))
-        if len(chart_points) == 1:
-            painter.drawPoint(chart_points[0][0], chart_points[0][1])
-        else:
-            for idx in range(len(chart_points) - 1):
-                painter.drawLine(
-                    chart_points[idx][0],
-                    chart_points[idx][1],
-                    chart_points[idx + 1][0],
-                    chart_points[idx + 1][1],
-                )
+        if not event.rect().intersects(self._plot_rect):
+            return
+        if self._polyline_rect != self._plot_rect:
+            chart_points: list[tuple[int, int]] = []
+            value_span = self._max_value - self._min_value
+            for t, v in self._points:
+                x_ratio = t / self._max_time if self._max_time > 0 else 0.0
+                y_ratio = (v - self._min_value) / value_span if value_span > 0 else 0.5
+                x = int(self._plot_rect.left() + self._plot_rect.width() * x_ratio)
+                y = int(self._plot_rect.bottom() - self._plot_rect.height() * y_ratio)
+                chart_points.append((x, y))
+            self._polyline = build_polyline(chart_points)
+            self._polyline_rect = QRect(self._plot_rect)
+
+        draw_polyline(painter, self._polyline, QPen(self.line_color(), 2))
 
         if self._selected_time is not None:
             selected_ratio = self._selected_time / self._max_time if self._max_time > 0 else 0.0
@@ -505,9 +545,13 @@ class MetricTimelineWidget(QWidget):
         ratio = (event.position().x() - self._plot_rect.left()) / max(1, self._plot_rect.width())
         ratio = max(0.0, min(1.0, ratio))
         second = ratio * self._max_time
+        previous_cursor = timeline_cursor_rect(self._plot_rect, self._max_time, self._selected_time)
         self._selected_time = second
         self.time_clicked.emit(second)
-        self.update()
+        # Only the old and new cursor columns need repainting.
+        if previous_cursor is not None:
+            self.update(previous_cursor)
+        self.update(timeline_cursor_rect(self._plot_rect, self._max_time, second))
 
 
 class CombinedLieTimelineWidget(QWidget):
@@ -529,6 +573,10 @@ class CombinedLieTimelineWidget(QWidget):
         self._show_combined = True
         self._show_audio = True
         self._show_video = True
+        # Keyed by the value's position in a point tuple: 1 combined, 2 audio, 3 video.
+        self._polylines: dict[int, QPolygon] = {}
+        self._polyline_rect = QRect()
+        self._update_timer = coalesced_update_timer(self)
 
     def set_points(self, points: list[dict[str, Any]], threshold: float = LIE_RISK_THRESHOLD) -> None:
         normalized: list[tuple[float, float, float | None, float | None]] = []
@@ -563,9 +611,11 @@ class CombinedLieTimelineWidget(QWidget):
         self._threshold = clamp_unit(threshold)
         self._has_audio = has_audio
         self._has_video = has_video
+        self._polylines = {}
+        self._polyline_rect = QRect()
         self._selected_time = None
         self._highlight_intervals = self._build_highlight_intervals()
-        self.update()
+        self._update_timer.start()
 
     def _build_highlight_intervals(self) -> list[tuple[float, float]]:
         if not self._points:
@@ -607,7 +657,7 @@ class CombinedLieTimelineWidget(QWidget):
             self._show_audio = bool(show_audio)
         if show_video is not None:
             self._show_video = bool(show_video)
-        self.update()
+        self._update_timer.start()
 
     def visible_series(self) -> list[tuple[str, QColor, str]]:
         items: list[tuple[str, QColor, str]] = []
@@ -693,43 +743,18 @@ class CombinedLieTimelineWidget(QWidget):
         painter.setPen(QColor("#991b1b"))
         painter.drawText(self._plot_rect.left() + 8, max(self._plot_rect.top() + 12, threshold_y - 4), f"Порог {self._threshold:.2f}")
 
-        def _draw_line(
-            value_getter,
-            color: QColor,
-            width: int = 2,
-            pen_style: Qt.PenStyle = Qt.PenStyle.SolidLine,
-        ) -> None:
-            line_points: list[tuple[int, int]] = []
-            for t, combined, audio_value, video_value in self._points:
-                value = value_getter(combined, audio_value, video_value)
-                if value is None:
-                    continue
-                x_ratio = t / self._max_time if self._max_time > 0 else 0.0
-                x = int(self._plot_rect.left() + self._plot_rect.width() * x_ratio)
-                y = int(self._plot_rect.bottom() - self._plot_rect.height() * clamp_unit(value))
-                line_points.append((x, y))
-
-            if len(line_points) == 1:
-                painter.setPen(QPen(color, width, pen_style))
-                painter.drawPoint(line_points[0][0], line_points[0][1])
-                return
-            if len(line_points) < 2:
-                return
-            painter.setPen(QPen(color, width, pen_style))
-            for idx in range(len(line_points) - 1):
-                painter.drawLine(
-                    line_points[idx][0],
-                    line_points[idx][1],
-                    line_points[idx + 1][0],
-                    line_points[idx + 1][1],
-                )
+        if not event.rect().intersects(self._plot_rect):
+            return
+        if self._polyline_rect != self._plot_rect:
+            self._polylines = {}
+            self._polyline_rect = QRect(self._plot_rect)
 
         if self._has_audio and self._show_audio:
-            _draw_line(lambda _, audio_value, __: audio_value, QColor("#0ea5e9"), width=1, pen_style=Qt.PenStyle.DashLine)
+            draw_polyline(painter, self._series_polyline(2), QPen(QColor("#0ea5e9"), 1, Qt.PenStyle.DashLine))
         if self._has_video and self._show_video:
-            _draw_line(lambda _, __, video_value: video_value, QColor("#16a34a"), width=1, pen_style=Qt.PenStyle.DashLine)
+            draw_polyline(painter, self._series_polyline(3), QPen(QColor("#16a34a"), 1, Qt.PenStyle.DashLine))
         if self._show_combined:
-            _draw_line(lambda combined, _audio_value, _video_value: combined, QColor("#dc2626"), width=2)
+            draw_polyline(painter, self._series_polyline(1), QPen(QColor("#dc2626"), 2))
 
         if self._selected_time is not None:
             selected_ratio = self._selected_time / self._max_time if self._max_time > 0 else 0.0
@@ -737,15 +762,35 @@ class CombinedLieTimelineWidget(QWidget):
             painter.setPen(QPen(QColor("#ef4444"), 2))
             painter.drawLine(selected_x, self._plot_rect.top(), selected_x, self._plot_rect.bottom())
 
+    def _series_polyline(self, value_index: int) -> QPolygon:
+        polyline = self._polylines.get(value_index)
+        if polyline is None:
+            line_points: list[tuple[int, int]] = []
+            for point in self._points:
+                value = point[value_index]
+                if value is None:
+                    continue
+                x_ratio = point[0] / self._max_time if self._max_time > 0 else 0.0
+                x = int(self._plot_rect.left() + self._plot_rect.width() * x_ratio)
+                y = int(self._plot_rect.bottom() - self._plot_rect.height() * clamp_unit(value))
+                line_points.append((x, y))
+            polyline = build_polyline(line_points)
+            self._polylines[value_index] = polyline
+        return polyline
+
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if not self._points or not self._plot_rect.contains(event.pos()):
             return
         ratio = (event.position().x() - self._plot_rect.left()) / max(1, self._plot_rect.width())
         ratio = max(0.0, min(1.0, ratio))
         second = ratio * self._max_time
+        previous_cursor = timeline_cursor_rect(self._plot_rect, self._max_time, self._selected_time)
         self._selected_time = second
         self.time_clicked.emit(second)
-        self.update()
+        # Only the old and new cursor columns need repainting.
+        if previous_cursor is not None:
+            self.update(previous_cursor)
+        self.update(timeline_cursor_rect(self._plot_rect, self._max_time, second))
 
 
 class PlaybackVideoWidget(QVideoWidget):
@@ -1902,31 +1947,29 @@ class ProjectView(QWidget):
 
     def _refresh_audio_providers_for_mode(self, mode: str) -> None:
         selected_code = str(self.audio_provider_combo.currentData() or "").strip().lower()
-        self.audio_provider_combo.blockSignals(True)
-        self.audio_provider_combo.clear()
-
-        normalized_mode = str(mode or "").strip().lower() or "audio_only"
-        providers_by_code = {item.code: item for item in self._audio_providers}
-        allowed_by_mode: dict[str, tuple[str, ...]] = {
-            "audio_only": ("native", "lie_detection"),
-            "video_only": ("lie_to_me",),
-            "audio_and_video": ("lie_to_me",),
-        }
-        allowed_codes = allowed_by_mode.get(normalized_mode, allowed_by_mode["audio_only"])
-        providers = [providers_by_code[code] for code in allowed_codes if code in providers_by_code]
-
-        for provider in providers:
-            self.audio_provider_combo.addItem(provider.title, provider.code)
+        with QSignalBlocker(self.audio_provider_combo):
+            self.audio_provider_combo.clear()
+
+            normalized_mode = str(mode or "").strip().lower() or "audio_only"
+            providers_by_code = {item.code: item for item in self._audio_providers}
+            allowed_by_mode: dict[str, tuple[str, ...]] = {
+                "audio_only": ("native", "lie_detection"),
+                "video_only": ("lie_to_me",),
+                "audio_and_video": ("lie_to_me",),
+            }
+            allowed_codes = allowed_by_mode.get(normalized_mode, allowed_by_mode["audio_only"])
+            providers = [providers_by_code[code] for code in allowed_codes if code in providers_by_code]
 
-        if self.audio_provider_combo.count() == 0:
-            self.audio_provider_combo.addItem("Нет подходящих провайдеров", "__none__")
+            for provider in providers:
+                self.audio_provider_combo.addItem(provider.title, provider.code)
 
-        if selected_code:
-            selected_index = self.audio_provider_combo.findData(selected_code)
-            if selected_index >= 0:
-                self.audio_provider_combo.setCurrentIndex(selected_index)
+            if self.audio_provider_combo.count() == 0:
+                self.audio_provider_combo.addItem("Нет подходящих провайдеров", "__none__")
 
-        self.audio_provider_combo.blockSignals(False)
+            if selected_code:
+                selected_index = self.audio_provider_combo.findData(selected_code)
+                if selected_index >= 0:
+                    self.audio_provider_combo.setCurrentIndex(selected_index)
 
     def _emit_cancel_processing(self) -> None:
         if self.current_project is None:
@@ -2338,7 +2381,7 @@ class ProjectView(QWidget):
         name, probability = dominant
         label = emotion_label_ru(name)
         color = EMOTION_COLORS.get(name)
-        if color is None and name in LIE_RISK_KEYS:
+        if color is None and name in LIE_RISK_KEY_SET:
             color = QColor("#dc2626")
         if color is None:
             color = QColor("#0ea5e9")
@@ -2347,7 +2390,7 @@ class ProjectView(QWidget):
     @staticmethod
     def _series_line_description(series_name: str) -> str:
         key = str(series_name).strip().lower()
-        if key in LIE_RISK_KEYS:
+        if key in LIE_RISK_KEY_SET:
             return "Линия показывает вероятность риска лжи в диапазоне 0..1."
         if key == "truth":
             return "Линия показывает вероятность правдивого ответа в диапазоне 0..1."
@@ -2402,7 +2445,7 @@ class ProjectView(QWidget):
             emotion_series = [
                 name
                 for name in report_video_series
-                if name not in LIE_RISK_KEYS and name != "truth"
+                if name not in LIE_RISK_KEY_SET and name != "truth"
             ]
 
             base_size = self.timeline_widget.size()
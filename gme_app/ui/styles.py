@@ -322,7 +322,7 @@ QLabel#SectionHint {
     color: #65719c;
 }
 
-QTableWidget#RunsTable {
+QTableView#RunsTable {
     border: 1px solid #dce4fb;
     border-radius: 12px;
     background: #ffffff;
@@ -338,7 +338,7 @@ QHeaderView::section {
     font-weight: 600;
 }
 
-QTableWidget::item {
+QTableView::item {
     border-bottom: 1px solid #eef2fe;
     padding: 8px;
 }
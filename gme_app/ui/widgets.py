@@ -78,7 +78,8 @@ class MetricCard(QFrame):
         layout.addStretch(1)
 
     def set_value(self, value: str) -> None:
-        self.value_label.setText(value)
+        if self.value_label.text() != value:
+            self.value_label.setText(value)
 
 
 class ProjectCard(QFrame):
@@ -100,28 +101,28 @@ class ProjectCard(QFrame):
         top_row = QHBoxLayout()
         top_row.setSpacing(10)
 
-        title = QLabel(project.title)
-        title.setObjectName("ProjectTitle")
-        title.setWordWrap(True)
-        title.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.title_label = QLabel(project.title)
+        self.title_label.setObjectName("ProjectTitle")
+        self.title_label.setWordWrap(True)
+        self.title_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
 
-        badge = StatusBadge(project_status_label(project.status), project.status)
-        top_row.addWidget(title, 1)
-        top_row.addWidget(badge, 0, Qt.AlignmentFlag.AlignTop)
+        self.status_badge = StatusBadge(project_status_label(project.status), project.status)
+        top_row.addWidget(self.title_label, 1)
+        top_row.addWidget(self.status_badge, 0, Qt.AlignmentFlag.AlignTop)
 
-        description = QLabel(project.description or "Описание не задано")
-        description.setWordWrap(True)
-        description.setObjectName("ProjectMeta")
-        description.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
-        description.setMaximumHeight(54)
+        self.description_label = QLabel(project.description or "Описание не задано")
+        self.description_label.setWordWrap(True)
+        self.description_label.setObjectName("ProjectMeta")
+        self.description_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.description_label.setMaximumHeight(54)
 
-        meta = QLabel(f"Обновлен: {format_datetime(project.updated_at)}")
-        meta.setObjectName("ProjectMeta")
-        meta.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.meta_label = QLabel(f"Обновлен: {format_datetime(project.updated_at)}")
+        self.meta_label.setObjectName("ProjectMeta")
+        self.meta_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
 
         footer = QHBoxLayout()
         footer.setSpacing(10)
-        footer.addWidget(meta, 1)
+        footer.addWidget(self.meta_label, 1)
 
         open_button = QPushButton("Открыть проект")
         open_button.setObjectName("PrimaryButton")
@@ -129,10 +130,24 @@ class ProjectCard(QFrame):
         footer.addWidget(open_button, 0)
 
         layout.addLayout(top_row)
-        layout.addWidget(description)
+        layout.addWidget(self.description_label)
         layout.addStretch(1)
         layout.addLayout(footer)
 
+    def update_project(self, project: Project) -> None:
+        previous = self.project
+        self.project = project
+        if project == previous:
+            return
+        if project.title != previous.title:
+            self.title_label.setText(project.title)
+        if project.status != previous.status:
+            self.status_badge.set_status(project.status, project_status_label(project.status))
+        if project.description != previous.description:
+            self.description_label.setText(project.description or "Описание не задано")
+        if project.updated_at != previous.updated_at:
+            self.meta_label.setText(f"Обновлен: {format_datetime(project.updated_at)}")
+
     def _emit_open_project(self) -> None:
         self.open_project_requested.emit(str(self.project.id))
 
@@ -148,6 +163,7 @@ class ResponsiveGrid(QWidget):
         super().__init__(parent)
         self._min_column_width = min_column_width
         self._items: list[QWidget] = []
+        self._placed_items: list[QWidget] = []
         self._last_columns = 0
         self._is_reflowing = False
         self._grid = QGridLayout(self)
@@ -156,19 +172,28 @@ class ResponsiveGrid(QWidget):
         self._grid.setVerticalSpacing(spacing)
 
     def set_min_column_width(self, value: int) -> None:
-        self._min_column_width = max(220, value)
+        value = max(220, value)
+        if value == self._min_column_width:
+            return
+        self._min_column_width = value
         self._reflow()
 
-    def set_items(self, widgets: list[QWidget]) -> None:
+    def set_items(self, widgets: list[QWidget], *, dispose_removed: bool = True) -> None:
         active_widget_ids = {id(widget) for widget in widgets}
         for widget in self._items:
             if id(widget) in active_widget_ids:
                 continue
             self._grid.removeWidget(widget)
-            widget.setParent(None)
-            widget.deleteLater()
+            if dispose_removed:
+                widget.setParent(None)
+                widget.deleteLater()
+            else:
+                widget.hide()
         self._items = widgets
         self._reflow()
+        for widget in widgets:
+            if widget.isHidden():
+                widget.show()
 
     def _clear_layout(self) -> None:
         while self._grid.count():
@@ -182,19 +207,23 @@ class ResponsiveGrid(QWidget):
             return
         self._is_reflowing = True
         try:
+            # Derive width from scroll viewport when available, otherwise use local widget width.
+            # This prevents stale content width from forcing a single long row after window resize.
+            available_width = max(self._available_width(), 1)
+            columns = max(1, available_width // self._min_column_width) if self._items else 0
+            # Resizes within the same column count leave the grid as it is.
+            if columns == self._last_columns and self._items == self._placed_items:
+                return
+
             self._clear_layout()
             for column in range(self._last_columns):
                 self._grid.setColumnStretch(column, 0)
+            self._placed_items = list(self._items)
 
             if not self._items:
                 self._last_columns = 0
                 return
 
-            # Derive width from scroll viewport when available, otherwise use local widget width.
-            # This prevents stale content width from forcing a single long row after window resize.
-            available_width = max(self._available_width(), 1)
-            columns = max(1, available_width // self._min_column_width)
-
             for index, widget in enumerate(self._items):
                 row = index // columns
                 column = index % columns
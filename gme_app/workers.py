@@ -22,6 +22,17 @@ class Worker(QRunnable):
         self.kwargs = kwargs
         self.signals = WorkerSignals()
 
+    def reset(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Prepare a finished worker for another task, dropping the previous task's slots."""
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        for signal in (self.signals.result, self.signals.error, self.signals.finished):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+
     def run(self) -> None:
         try:
             result = self.fn(*self.args, **self.kwargs)